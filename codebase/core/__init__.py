@@ -3,7 +3,6 @@
 Unified core module for all platforms (Linux, macOS).
 """
 
-from .auth import do_saml_auth, _get_gp_prelogin
 from .config import (
     get_connections,
     get_all_connections,  # Alias for backwards compatibility
@@ -28,9 +27,12 @@ from .cookies import (
 )
 from .connect import (
     connect_vpn,
+    disable_colors,
     disconnect,
+    find_openconnect_processes,
+    signal_openconnect,
 )
-from .totp import generate_totp, validate_secret
+from .totp import generate_totp, normalize_secret, secret_error, validate_secret
 
 __all__ = [
     # Auth
@@ -57,8 +59,33 @@ __all__ = [
     "clear_nm_cookies",
     # Connect
     "connect_vpn",
+    "disable_colors",
     "disconnect",
+    "find_openconnect_processes",
+    "signal_openconnect",
     # TOTP
     "generate_totp",
+    "normalize_secret",
+    "secret_error",
     "validate_secret",
 ]
+
+
+# Exports resolved on first access, mapped to the submodule that defines
+# them. auth pulls in Playwright, which only authentication needs.
+_LAZY_EXPORTS = {
+    "do_saml_auth": "auth",
+    "_get_gp_prelogin": "auth",
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names (PEP 562) on first use."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
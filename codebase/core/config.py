@@ -106,16 +106,20 @@ def delete_connection(name: str) -> bool:
     return False
 
 
-def get_config(name: str) -> Optional[tuple]:
+def get_config(name: str, connections: Optional[dict] = None) -> Optional[tuple]:
     """Get full config tuple for a connection.
 
     Args:
         name: Connection name
+        connections: Already-loaded connections (skips the keyring read)
 
     Returns:
         (name, address, protocol, username, password, totp_secret) or None
     """
-    conn = get_connection(name)
+    if connections is None:
+        conn = get_connection(name)
+    else:
+        conn = connections.get(name)
     if conn:
         return (
             name,
@@ -1,40 +1,58 @@
 """VPN connection management via openconnect."""
 
+import functools
 import os
 import re
 import shlex
+import shutil
+import signal
+import socket
 import subprocess
+import sys
 from typing import Optional
 
 from .cookies import store_cookies, clear_cookies
 from .config import PROTOCOLS
 
-# Terminal colors
-GREEN = "\033[32m"
-RED = "\033[31m"
-YELLOW = "\033[33m"
-CYAN = "\033[36m"
-BOLD = "\033[1m"
-NC = "\033[0m"
+# Terminal colors, only when writing to a terminal (see disable_colors)
+if sys.stdout.isatty():
+    GREEN = "\033[32m"
+    RED = "\033[31m"
+    YELLOW = "\033[33m"
+    CYAN = "\033[36m"
+    BOLD = "\033[1m"
+    NC = "\033[0m"
+else:
+    GREEN = RED = YELLOW = CYAN = BOLD = NC = ""
+
+# GlobalProtect prints the long-lived portal cookie on stdout
+_PORTAL_COOKIE_RE = re.compile(r'portal-userauthcookie=(\S+)')
+
+
+def disable_colors() -> None:
+    """Print status lines without colors, even on a terminal (CLI --quiet)."""
+    global GREEN, RED, YELLOW, CYAN, BOLD, NC
+    GREEN = RED = YELLOW = CYAN = BOLD = NC = ""
+
+
+def _join_cookies(cookies: dict) -> str:
+    """Format cookies as a "name=value; name=value" string for --cookie."""
+    return "; ".join([f"{k}={v}" for k, v in cookies.items()])
+
+
+def _have_tool(name: str) -> bool:
+    """Check if a system tool is installed (including sbin dirs)."""
+    search_path = os.pathsep.join([os.environ.get("PATH", ""), "/usr/sbin", "/sbin"])
+    return shutil.which(name, path=search_path) is not None
 
 
 def _cleanup_dns_best_effort(use_pkexec: bool = False) -> None:
     """Best-effort DNS cleanup for tun interfaces after failure/disconnect."""
     tun_devs = set()
     try:
-        links = subprocess.run(
-            ["ip", "-o", "link", "show"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        for line in links.stdout.splitlines():
-            if ":" not in line:
-                continue
-            parts = line.split(":", 2)
-            if len(parts) < 2:
-                continue
-            dev = parts[1].strip()
+        # if_nameindex() asks the kernel directly (netlink on Linux), so we
+        # don't need to fork `ip` and parse its text output.
+        for _, dev in socket.if_nameindex():
             if dev.startswith("tun"):
                 tun_devs.add(dev)
     except Exception:
@@ -50,15 +68,32 @@ def _cleanup_dns_best_effort(use_pkexec: bool = False) -> None:
         else:
             candidates.append(["sudo", "-n"] + cmd)
 
+        # Stop at the first candidate that works: escalating after an
+        # unprivileged success only costs another fork (and a pkexec prompt).
         for full_cmd in candidates:
             try:
-                subprocess.run(full_cmd, capture_output=True, text=True, check=False, timeout=5)
+                result = subprocess.run(
+                    full_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                    timeout=5,
+                )
             except Exception:
                 continue
+            if result.returncode == 0:
+                return
+
+    # Only call resolvers that exist here; otherwise every device costs a
+    # fork (and possibly a pkexec prompt) just to fail.
+    use_resolvectl = os.path.isdir("/run/systemd/resolve") and _have_tool("resolvectl")
+    use_resolvconf = _have_tool("resolvconf")
 
     for dev in sorted(tun_devs):
-        _run_cleanup_cmd(["resolvectl", "revert", dev])
-        _run_cleanup_cmd(["resolvconf", "-d", dev])
+        if use_resolvectl:
+            _run_cleanup_cmd(["resolvectl", "revert", dev])
+        if use_resolvconf:
+            _run_cleanup_cmd(["resolvconf", "-d", dev])
 
 
 def connect_vpn(
@@ -110,7 +145,7 @@ def connect_vpn(
                 cookie_str = cookies['prelogin-cookie']
                 print(f"  Using prelogin-cookie")
             else:
-                cookie_str = "; ".join([f"{k}={v}" for k, v in cookies.items()])
+                cookie_str = _join_cookies(cookies)
                 print(f"  Using combined cookies")
         elif 'prelogin-cookie' in cookies:
             cookie_str = cookies['prelogin-cookie']
@@ -129,12 +164,12 @@ def connect_vpn(
             gp_cookie_type = 'portal-userauthcookie'
             print(f"  Using SESSID - may not work for GP SAML")
         else:
-            cookie_str = "; ".join([f"{k}={v}" for k, v in cookies.items()])
+            cookie_str = _join_cookies(cookies)
             gp_cookie_type = 'portal-userauthcookie'
             print(f"  Using combined cookies")
     else:
         # AnyConnect uses name=value format
-        cookie_str = "; ".join([f"{k}={v}" for k, v in cookies.items()])
+        cookie_str = _join_cookies(cookies)
 
     connect_target = vpn_server
 
@@ -220,8 +255,8 @@ def connect_vpn(
             for line in process.stdout:
                 print(line, end='')
 
-                if 'portal-userauthcookie=' in line and protocol == "gp":
-                    match = re.search(r'portal-userauthcookie=(\S+)', line)
+                if protocol == "gp" and 'portal-userauthcookie=' in line:
+                    match = _PORTAL_COOKIE_RE.search(line)
                     if match:
                         portal_cookie = match.group(1)
                         if portal_cookie.lower() != 'empty':
@@ -252,6 +287,100 @@ def connect_vpn(
     return True
 
 
+def find_openconnect_processes() -> Optional[dict[int, str]]:
+    """Find running openconnect processes by scanning /proc.
+
+    Reads /proc/<pid>/comm directly instead of forking pgrep.
+
+    Returns:
+        {pid: command line} (shell-quoted, as shlex.split expects), or
+        None if /proc is not available (e.g. macOS)
+    """
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        return None
+
+    processes = {}
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/comm", "rb") as f:
+                    if f.read() != b"openconnect\n":
+                        continue
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    argv = f.read().rstrip(b"\0").split(b"\0")
+            except OSError:
+                # Process exited while scanning
+                continue
+            processes[int(entry.name)] = shlex.join(
+                arg.decode(errors="replace") for arg in argv
+            )
+    return processes
+
+
+def _find_openconnect_pids() -> Optional[list[int]]:
+    """Find running openconnect PIDs (None if /proc is not available)."""
+    processes = find_openconnect_processes()
+    return None if processes is None else list(processes)
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_sees_all_processes() -> bool:
+    """Check whether a process scan can see other users' processes.
+
+    With /proc mounted hidepid=1/2, an unprivileged scan can't see root's
+    openconnect, so an empty result proves nothing. Without /proc (macOS)
+    callers list processes with ps, which shows every user's.
+    """
+    if os.geteuid() == 0 or not os.path.isdir("/proc"):
+        return True
+    try:
+        with open("/proc/1/comm", "rb"):
+            return True
+    except OSError:
+        return False
+
+
+def _kill_pids(pids: list[int], sig: int) -> Optional[bool]:
+    """Signal processes directly.
+
+    Returns:
+        True if any process was signalled, False if all had already exited,
+        or None if we lack permission (caller should escalate)
+    """
+    signalled = False
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            continue
+        except PermissionError:
+            return None
+        signalled = True
+    return signalled
+
+
+def signal_openconnect(pids: list[int], sig: int) -> Optional[bool]:
+    """Signal scanned openconnect processes without escalating.
+
+    Args:
+        pids: PIDs found by a process scan
+        sig: Signal to send
+
+    Returns:
+        True if signalled, False if nothing is running, or None if the
+        caller should escalate (permission denied, or the scan may have
+        missed root's processes)
+    """
+    killed = _kill_pids(pids, sig) if pids else False
+    if killed is False and not _scan_sees_all_processes():
+        return None
+    return killed
+
+
 def disconnect(force: bool = False) -> bool:
     """Kill any running openconnect process.
 
@@ -261,12 +390,21 @@ def disconnect(force: bool = False) -> bool:
     Returns:
         True if process was killed
     """
-    signal_flag = "-TERM" if force else "-KILL"
-    result = subprocess.run(
-        ["sudo", "pkill", signal_flag, "-f", "openconnect"],
-        capture_output=True
-    )
-    if result.returncode == 0:
+    pids = _find_openconnect_pids()
+    killed = None
+    if pids is not None:
+        # An empty, complete scan means nothing is running; don't fork
+        # sudo just to hear that.
+        killed = signal_openconnect(pids, signal.SIGTERM if force else signal.SIGKILL)
+    if killed is None:
+        signal_flag = "-TERM" if force else "-KILL"
+        result = subprocess.run(
+            ["sudo", "pkill", signal_flag, "-f", "openconnect"],
+            capture_output=True
+        )
+        killed = result.returncode == 0
+
+    if killed:
         _cleanup_dns_best_effort(use_pkexec=False)
         if force:
             clear_cookies()
@@ -134,9 +134,11 @@ def clear_cookies(name: Optional[str] = None) -> bool:
             if cookie_file.exists():
                 cookie_file.unlink()
         else:
-            cache_dir = _get_user_cache_dir()
-            for f in cache_dir.glob("session_*.json"):
-                f.unlink()
+            # One directory scan; no per-entry Path objects or pattern matching
+            with os.scandir(_get_user_cache_dir()) as entries:
+                for entry in entries:
+                    if entry.name.startswith("session_") and entry.name.endswith(".json"):
+                        os.unlink(entry.path)
         return True
     except Exception:
         return False
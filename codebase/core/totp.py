@@ -1,17 +1,30 @@
 """TOTP helpers."""
 
 import base64
+import binascii
 import hashlib
 import hmac
 import struct
 import time
+from typing import Optional
+
+# Separators people paste along with a secret (spaces, dashes, line breaks)
+_WS_TABLE = str.maketrans("", "", " \t\r\n-")
+
+
+def normalize_secret(secret: str) -> str:
+    """Canonicalize a base32 secret: drop separators, uppercase, pad to 8."""
+    if not secret:
+        return ""
+    secret = secret.translate(_WS_TABLE).upper()
+    return secret + "=" * (-len(secret) % 8)
 
 
 def generate_totp(secret: str, digits: int = 6, period: int = 30) -> str:
     """Generate a TOTP code for a base32 secret."""
     if not secret:
         return ""
-    key = base64.b32decode(secret.strip().replace(" ", "").upper())
+    key = base64.b32decode(normalize_secret(secret))
     counter = int(time.time() // period)
     msg = struct.pack(">Q", counter)
     digest = hmac.new(key, msg, hashlib.sha1).digest()
@@ -21,10 +34,21 @@ def generate_totp(secret: str, digits: int = 6, period: int = 30) -> str:
     return str(code).zfill(digits)
 
 
-def validate_secret(secret: str) -> bool:
-    """Check if a TOTP secret is valid base32."""
+def secret_error(secret: str) -> Optional[str]:
+    """Return why a TOTP secret is not valid base32, or None if it is.
+
+    The secret is normalized first, so pasted separators and lowercase are
+    fine. An empty secret is not an error (TOTP is optional).
+    """
+    if not secret:
+        return None
     try:
-        generate_totp(secret)
-        return True
-    except Exception:
-        return False
+        base64.b32decode(normalize_secret(secret))
+    except binascii.Error as e:
+        return str(e)
+    return None
+
+
+def validate_secret(secret: str) -> bool:
+    """Check if a TOTP secret is valid base32 (see secret_error)."""
+    return secret_error(secret) is None
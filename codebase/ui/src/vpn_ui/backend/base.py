@@ -12,9 +12,12 @@ class VPNBackendProtocol(Protocol):
 
     # Connection Management (uses core module)
 
-    def get_connections(self) -> dict:
+    def get_connections(self, refresh: bool = False) -> dict:
         """Get all saved VPN connections.
 
+        Args:
+            refresh: Read the keyring even if a cached list is available
+
         Returns:
             Dictionary of connection name -> connection details
         """
@@ -188,6 +191,22 @@ class VPNBackendProtocol(Protocol):
         """
         ...
 
+    def get_openconnect_pid(self) -> Optional[int]:
+        """Get the PID of the running openconnect process.
+
+        Returns:
+            PID, or None if not running or not supported on this platform
+        """
+        ...
+
+    def invalidate_process_cache(self) -> None:
+        """Forget the cached openconnect process listing.
+
+        is_connected() and related probes reuse one process listing for
+        about a second; call this when the process is known to have changed.
+        """
+        ...
+
     # State Management
 
     def save_active_connection(self, name: str) -> None:
@@ -223,6 +242,28 @@ class VPNBackendProtocol(Protocol):
         """
         ...
 
+    def normalize_totp_secret(self, secret: str) -> str:
+        """Canonicalize a TOTP secret (no separators, uppercase, padded).
+
+        Args:
+            secret: Base32-encoded TOTP secret as entered
+
+        Returns:
+            Normalized secret
+        """
+        ...
+
+    def totp_secret_error(self, secret: str) -> Optional[str]:
+        """Check that a TOTP secret is valid base32.
+
+        Args:
+            secret: Base32-encoded TOTP secret
+
+        Returns:
+            Why the secret can't be used to generate codes, or None if it can
+        """
+        ...
+
     def get_config(self, name: str) -> Optional[tuple]:
         """Get full configuration for a connection.
 
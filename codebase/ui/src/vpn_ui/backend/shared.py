@@ -4,9 +4,15 @@ This module contains the core module setup and methods that are
 identical across Linux and macOS.
 """
 
-import json
 import os
+import re
+import shlex
+import subprocess
 import sys
+import threading
+import time
+import urllib.parse
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +30,39 @@ else:
     SYSTEM_BROWSERS = Path("/opt/ms-sso-openconnect-ui/browsers")
     USER_APP_BUNDLE = None
 
+# State file as str: polled via os.stat, which skips Path's overhead
+_STATE_FILE_PATH = str(STATE_FILE)
+
+# How long a process listing is reused by is_connected() and friends (seconds)
+PROCESS_PROBE_TTL = 1.0
+
+# Without /proc a remembered PID can't be matched to openconnect, so it is
+# only trusted this long (seconds) before the next full scan.
+PID_TRUST_TTL = 10.0
+_HAVE_PROC = os.path.isdir("/proc")
+
+# `ps -Ao pid=,args=` lines whose argv[0] is openconnect: (pid, command line)
+_PS_OPENCONNECT_RE = re.compile(r"^\s*(\d+)\s+((?:\S*/)?openconnect(?:[ \t].*)?)$", re.M)
+
+# How long the keyring's connection list is reused for listings (seconds).
+# The keyring has no modification time to key on, so a TTL is the cheapest
+# staleness bound. Writes made through the backend invalidate it, and
+# lookups that feed a connect always read fresh (see get_config).
+CONNECTIONS_CACHE_TTL = 5.0
+
+
+@lru_cache(maxsize=None)
+def _venv_site_packages(venv: Path) -> Optional[Path]:
+    """Locate a venv's site-packages directory.
+
+    Tries the running interpreter's lib/pythonX.Y first, which avoids a
+    directory scan in the usual case, then falls back to globbing.
+    """
+    site_packages = venv / f"lib/python{sys.version_info[0]}.{sys.version_info[1]}/site-packages"
+    if site_packages.is_dir():
+        return site_packages
+    return next(venv.glob("lib/python*/site-packages"), None)
+
 
 def _setup_system_venv():
     """Add system venv to path if it exists."""
@@ -47,10 +86,9 @@ def _setup_system_venv():
     for venv in venv_paths:
         if venv and venv.exists():
             # Find site-packages directory
-            for python_ver in venv.glob("lib/python*/site-packages"):
-                if python_ver.exists() and str(python_ver) not in sys.path:
-                    sys.path.insert(0, str(python_ver))
-                    break
+            site_packages = _venv_site_packages(venv)
+            if site_packages and str(site_packages) not in sys.path:
+                sys.path.insert(0, str(site_packages))
 
             # Set playwright browsers path
             browsers = venv.parent / "browsers" if "venv" in str(venv) else SYSTEM_BROWSERS
@@ -59,8 +97,12 @@ def _setup_system_venv():
             break
 
 
+@lru_cache(maxsize=1)
 def _setup_core_module():
     """Add core module to path if not already importable."""
+    if "core" in sys.modules:
+        return
+
     # Try to import core module
     try:
         import core
@@ -83,9 +125,7 @@ def _setup_core_module():
     # Development layout:
     # codebase/ui/src/vpn_ui/backend/shared.py -> ../../../../.. -> repo root
     repo_root = Path(__file__).resolve().parents[5]
-    codebase_root = repo_root / "codebase"
-    if (codebase_root / "core").exists():
-        search_paths.append(codebase_root)
+    search_paths.append(repo_root / "codebase")
 
     # macOS app bundle
     if sys.platform == "darwin":
@@ -102,7 +142,8 @@ def _setup_core_module():
     ])
 
     for path in search_paths:
-        if path.exists() and (path / "core").exists():
+        # One stat per candidate: core/ can only exist if path does
+        if os.path.isdir(os.path.join(path, "core")):
             if str(path) not in sys.path:
                 sys.path.insert(0, str(path))
             return
@@ -121,7 +162,6 @@ _setup_core_module()
 from core import (
     # Config
     get_all_connections,
-    get_connection,
     save_connection,
     delete_connection,
     get_config,
@@ -130,15 +170,35 @@ from core import (
     store_cookies,
     get_stored_cookies,
     clear_stored_cookies,
-    # Auth
-    do_saml_auth,
     # Connect
     connect_vpn as _connect_vpn,
+    find_openconnect_processes,
+    signal_openconnect,
     # TOTP
     generate_totp,
+    normalize_secret,
+    secret_error,
 )
 
 
+def _normalize_host(value: str) -> str:
+    """Reduce a server address or URL to a lowercase host name."""
+    text = (value or "").strip()
+    if not text:
+        return ""
+    try:
+        parsed = urllib.parse.urlparse(text if "://" in text else f"//{text}")
+        host = parsed.hostname or parsed.path or text
+    except Exception:
+        host = text
+    host = host.strip().lower()
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1]
+    if ":" in host and host.count(":") == 1:
+        host = host.split(":", 1)[0]
+    return host
+
+
 class SharedBackendMixin:
     """Mixin class providing shared backend functionality.
 
@@ -147,15 +207,124 @@ class SharedBackendMixin:
     the platform-specific methods (connect_vpn, disconnect, is_connected).
     """
 
+    _proc_cache: Optional[tuple] = None  # (monotonic time, {pid: cmdline})
+    _openconnect_pid: Optional[int] = None  # Last PID seen by a scan
+    _openconnect_pid_time = 0.0  # monotonic time of that scan
+    _conn_cache: Optional[tuple] = None  # (monotonic time, connections)
+    _state_cache: Optional[tuple] = None  # (state file mtime_ns, active name)
+    _state_dir_ready = False
+    _host_index: Optional[tuple] = None  # (connections dict, {host: entries})
+    # Guards the process and state caches: the tray's status probe runs on
+    # pool threads while the GUI thread invalidates and saves state
+    _cache_lock = threading.RLock()
+
+    # Process Probe
+
+    def _probe_openconnect(self) -> dict:
+        """List running openconnect processes as {pid: cmdline}.
+
+        A single scan serves is_connected, get_openconnect_pid and
+        infer_connection_name; the result is reused for PROCESS_PROBE_TTL.
+        Reads /proc where available and falls back to one ps call (macOS,
+        where pgrep can't print command lines).
+        """
+        with self._cache_lock:
+            cached = self._proc_cache
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < PROCESS_PROBE_TTL:
+                return cached[1]
+
+            processes = find_openconnect_processes()
+            if processes is None:
+                processes = {}
+                try:
+                    result = subprocess.run(
+                        ["ps", "-Ao", "pid=,args="],
+                        capture_output=True,
+                        text=True
+                    )
+                    for match in _PS_OPENCONNECT_RE.finditer(result.stdout):
+                        processes[int(match.group(1))] = match.group(2)
+                except Exception:
+                    pass
+
+            self._proc_cache = (now, processes)
+            if processes:
+                self._openconnect_pid = max(processes)
+                self._openconnect_pid_time = now
+            return processes
+
+    def _openconnect_running(self) -> bool:
+        """Check whether openconnect is running.
+
+        Once a scan has found openconnect, its PID is re-checked instead
+        of scanning again. With /proc, /proc/<pid>/comm must still read
+        openconnect, so a reused PID doesn't count. Without /proc (macOS),
+        os.kill(pid, 0) can't tell who owns the PID, so it is only trusted
+        for PID_TRUST_TTL after the scan.
+        """
+        with self._cache_lock:
+            pid = self._openconnect_pid
+            if pid is not None:
+                if _HAVE_PROC:
+                    try:
+                        with open(f"/proc/{pid}/comm", "rb") as f:
+                            if f.read() == b"openconnect\n":
+                                return True
+                    except OSError:
+                        pass
+                elif time.monotonic() - self._openconnect_pid_time < PID_TRUST_TTL:
+                    try:
+                        os.kill(pid, 0)
+                        return True
+                    except PermissionError:
+                        return True  # Exists, but owned by root
+                    except OSError:
+                        pass
+                self._openconnect_pid = None
+            return bool(self._probe_openconnect())
+
+    def invalidate_process_cache(self) -> None:
+        """Forget the cached process listing (after connect/disconnect)."""
+        with self._cache_lock:
+            self._proc_cache = None
+            self._openconnect_pid = None
+
+    def _signal_openconnect(self, sig: int) -> Optional[bool]:
+        """Signal openconnect directly, based on a fresh scan.
+
+        Returns:
+            True if signalled, False if nothing is running, or None if the
+            caller must escalate (see core.signal_openconnect)
+        """
+        with self._cache_lock:
+            self.invalidate_process_cache()
+            pids = list(self._probe_openconnect())
+        return signal_openconnect(pids, sig)
+
     # Connection Management
 
-    def get_connections(self) -> dict:
-        """Get all saved VPN connections."""
-        return get_all_connections()
+    def get_connections(self, refresh: bool = False) -> dict:
+        """Get all saved VPN connections.
+
+        Each keyring read is a secret-service round-trip, so the result is
+        reused for CONNECTIONS_CACHE_TTL unless refresh is set.
+        """
+        cached = self._conn_cache
+        now = time.monotonic()
+        if (
+            not refresh
+            and cached is not None
+            and now - cached[0] < CONNECTIONS_CACHE_TTL
+        ):
+            return cached[1]
+        connections = get_all_connections()
+        self._conn_cache = (now, connections)
+        return connections
 
     def get_connection(self, name: str) -> Optional[dict]:
-        """Get a specific connection by name."""
-        return get_connection(name)
+        """Get a specific connection by name (always read fresh)."""
+        return self.get_connections(refresh=True).get(name)
 
     def save_connection(
         self,
@@ -174,6 +343,8 @@ class SharedBackendMixin:
             return True
         except Exception:
             return False
+        finally:
+            self._conn_cache = None
 
     def delete_connection(self, name: str) -> bool:
         """Delete a VPN connection."""
@@ -182,6 +353,8 @@ class SharedBackendMixin:
             return True
         except Exception:
             return False
+        finally:
+            self._conn_cache = None
 
     # Cookie/Session Management
 
@@ -223,6 +396,9 @@ class SharedBackendMixin:
         debug: bool = False
     ) -> Optional[dict]:
         """Perform SAML authentication via browser automation."""
+        # Deferred: pulls in Playwright, which only authentication needs
+        from core import do_saml_auth
+
         return do_saml_auth(
             vpn_server,
             username,
@@ -238,24 +414,63 @@ class SharedBackendMixin:
 
     def save_active_connection(self, name: str) -> None:
         """Save the active connection name to state file."""
-        STATE_DIR.mkdir(parents=True, exist_ok=True)
-        state = {"active_connection": name}
-        STATE_FILE.write_text(json.dumps(state))
+        with self._cache_lock:
+            cached = self._state_cache
+            if cached is not None and cached[1] == name:
+                # Skip the write if the file still holds this name
+                try:
+                    if os.stat(_STATE_FILE_PATH).st_mtime_ns == cached[0]:
+                        return
+                except OSError:
+                    pass
+
+            if not self._state_dir_ready:
+                STATE_DIR.mkdir(parents=True, exist_ok=True)
+                self._state_dir_ready = True
+            # Write via temp file + rename so the status poll never reads a
+            # truncated file
+            tmp_path = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+            try:
+                with open(tmp_path, "w") as f:
+                    f.write(name)
+                os.replace(tmp_path, STATE_FILE)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._state_cache = (STATE_FILE.stat().st_mtime_ns, name)
 
     def get_active_connection(self) -> Optional[str]:
-        """Get the active connection name from state file."""
-        if not STATE_FILE.exists():
-            return None
-        try:
-            state = json.loads(STATE_FILE.read_text())
-            return state.get("active_connection")
-        except Exception:
-            return None
+        """Get the active connection name from state file.
+
+        The name is kept until the file's mtime changes, so the
+        status poll costs a stat instead of a read.
+        """
+        with self._cache_lock:
+            try:
+                mtime_ns = os.stat(_STATE_FILE_PATH).st_mtime_ns
+            except OSError:
+                return None
+            cached = self._state_cache
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            try:
+                name = STATE_FILE.read_text().strip() or None
+            except Exception:
+                name = None
+            self._state_cache = (mtime_ns, name)
+            return name
 
     def clear_active_connection(self) -> None:
         """Clear the active connection state."""
-        if STATE_FILE.exists():
-            STATE_FILE.unlink()
+        with self._cache_lock:
+            self._state_cache = None
+            try:
+                os.unlink(_STATE_FILE_PATH)
+            except FileNotFoundError:
+                pass
 
     # Utilities
 
@@ -263,63 +478,51 @@ class SharedBackendMixin:
         """Generate a TOTP code from a secret."""
         return generate_totp(secret)
 
+    def normalize_totp_secret(self, secret: str) -> str:
+        """Canonicalize a base32 TOTP secret."""
+        return normalize_secret(secret)
+
+    def totp_secret_error(self, secret: str) -> Optional[str]:
+        """Return why a TOTP secret is not valid base32, or None."""
+        return secret_error(secret)
+
     def get_config(self, name: str) -> Optional[tuple]:
-        """Get full configuration for a connection."""
-        return get_config(name)
+        """Get full configuration for a connection.
+
+        Reads the keyring fresh, so a connect never uses credentials that
+        were changed from the CLI within the cache TTL.
+        """
+        return get_config(name, self.get_connections(refresh=True))
+
+    def _connections_by_host(self) -> dict:
+        """Index saved connections as {host: [(name, protocol), ...]}.
+
+        Rebuilt only when get_connections() hands out a new dict.
+        """
+        connections = self.get_connections()
+        cached = self._host_index
+        if cached is not None and cached[0] is connections:
+            return cached[1]
+        index = {}
+        for name, details in connections.items():
+            conn_host = _normalize_host(details.get("address", "") or "")
+            if not conn_host:
+                continue
+            conn_protocol = (details.get("protocol", "") or "").strip().lower()
+            index.setdefault(conn_host, []).append((name, conn_protocol))
+        self._host_index = (connections, index)
+        return index
 
     def infer_connection_name(self) -> Optional[str]:
         """Try to infer connection name from running openconnect process."""
-        import shlex
-        import subprocess
-        import urllib.parse
-
-        def _normalize_host(value: str) -> str:
-            text = (value or "").strip()
-            if not text:
-                return ""
-            try:
-                parsed = urllib.parse.urlparse(text if "://" in text else f"//{text}")
-                host = parsed.hostname or parsed.path or text
-            except Exception:
-                host = text
-            host = host.strip().lower()
-            if host.startswith("[") and host.endswith("]"):
-                host = host[1:-1]
-            if ":" in host and host.count(":") == 1:
-                host = host.split(":", 1)[0]
-            return host
-
-        if not self.is_connected():
-            return None
-
         try:
             # Get the openconnect process command line
-            result = subprocess.run(
-                ["pgrep", "-a", "openconnect"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                return None
-
-            lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-            if not lines:
+            processes = self._probe_openconnect()
+            if not processes:
                 return None
 
             # Prefer the most recently started openconnect process (highest PID).
-            chosen_cmd = None
-            chosen_pid = -1
-            for line in lines:
-                parts = line.split(maxsplit=1)
-                if len(parts) < 2:
-                    continue
-                try:
-                    pid = int(parts[0])
-                except Exception:
-                    continue
-                if pid >= chosen_pid:
-                    chosen_pid = pid
-                    chosen_cmd = parts[1]
+            chosen_cmd = processes[max(processes)]
             if not chosen_cmd:
                 return None
 
@@ -330,45 +533,38 @@ class SharedBackendMixin:
             if len(tokens) < 2:
                 return None
 
+            # One pass over argv: protocol, explicit --server, and the last
+            # positional argument as a fallback server address.
             cmd_protocol = None
-            skip_next = False
-            for idx, tok in enumerate(tokens):
-                if skip_next:
-                    skip_next = False
+            server_address = None
+            last_positional = None
+            pending_option = None  # option whose value is the next token
+            for tok in tokens:
+                if not tok.startswith("-") and tok != "openconnect":
+                    last_positional = tok
+
+                if pending_option is not None:
+                    if pending_option == "--protocol":
+                        proto = tok.strip().lower()
+                        if proto in {"gp", "anyconnect"}:
+                            cmd_protocol = proto
+                    elif server_address is None:
+                        server_address = tok
+                    pending_option = None
                     continue
 
-                if tok.startswith("--protocol="):
+                if tok in ("--protocol", "--server"):
+                    pending_option = tok
+                elif tok.startswith("--protocol="):
                     proto = tok.split("=", 1)[1].strip().lower()
                     if proto in {"gp", "anyconnect"}:
                         cmd_protocol = proto
-                    continue
-                if tok == "--protocol" and idx + 1 < len(tokens):
-                    proto = tokens[idx + 1].strip().lower()
-                    if proto in {"gp", "anyconnect"}:
-                        cmd_protocol = proto
-                    skip_next = True
-                    continue
-
-                if tok == "--protocol":
-                    skip_next = True
-                    continue
-
-            server_address = None
-            for tok in tokens:
-                if tok.startswith("--server="):
+                elif tok.startswith("--server=") and server_address is None:
                     server_address = tok.split("=", 1)[1]
-                    break
-            if not server_address:
-                for idx, tok in enumerate(tokens):
-                    if tok == "--server" and idx + 1 < len(tokens):
-                        server_address = tokens[idx + 1]
-                        break
+
             if not server_address:
                 # Fallback: openconnect server is typically the last positional arg.
-                for tok in reversed(tokens):
-                    if not tok.startswith("-") and tok != "openconnect":
-                        server_address = tok
-                        break
+                server_address = last_positional
 
             if not server_address:
                 return None
@@ -376,17 +572,18 @@ class SharedBackendMixin:
             if not server_host:
                 return None
 
-            # Match against saved connections
-            connections = self.get_connections()
-            for name, details in connections.items():
-                conn_address = details.get("address", "") or ""
-                conn_host = _normalize_host(conn_address)
-                if not conn_host:
-                    continue
-                conn_protocol = (details.get("protocol", "") or "").strip().lower()
-                if cmd_protocol and conn_protocol and conn_protocol != cmd_protocol:
-                    continue
-                if conn_host == server_host:
+            # Match against saved connections: exact host first, then parent
+            # domains (e.g. a gateway under the saved portal's domain). IP
+            # addresses only match exactly.
+            by_host = self._connections_by_host()
+            candidates = [server_host]
+            labels = server_host.split(".")
+            if ":" not in server_host and not labels[-1].isdigit():
+                candidates += [".".join(labels[i:]) for i in range(1, len(labels) - 1)]
+            for host in candidates:
+                for name, conn_protocol in by_host.get(host, ()):
+                    if cmd_protocol and conn_protocol and conn_protocol != cmd_protocol:
+                        continue
                     return name
 
         except Exception:
@@ -1,8 +1,9 @@
 """Connection form widget for adding/editing VPN connections."""
 
+from functools import partial
 from typing import Optional
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
     QFormLayout,
@@ -14,7 +15,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from vpn_ui.constants import PROTOCOLS
+from vpn_ui.constants import get_protocol_model
+from vpn_ui.worker import run_in_background
 
 
 class ConnectionForm(QWidget):
@@ -54,8 +56,7 @@ class ConnectionForm(QWidget):
 
         # Protocol selection
         self.protocol_combo = QComboBox()
-        for proto_id, proto_info in PROTOCOLS.items():
-            self.protocol_combo.addItem(proto_info["name"], proto_id)
+        self.protocol_combo.setModel(get_protocol_model())
         layout.addRow("Protocol:", self.protocol_combo)
 
         # Username
@@ -66,21 +67,18 @@ class ConnectionForm(QWidget):
         # Password
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addRow("Password:", self.password_edit)
 
         # Show/hide password button
-        self._password_visible = False
         self.toggle_password_btn = QPushButton("Show")
         self.toggle_password_btn.setFixedWidth(60)
-        self.toggle_password_btn.clicked.connect(self._toggle_password_visibility)
+        self.toggle_password_btn.clicked.connect(
+            partial(self._toggle_echo, self.password_edit, self.toggle_password_btn)
+        )
 
         password_layout = QHBoxLayout()
         password_layout.addWidget(self.password_edit)
         password_layout.addWidget(self.toggle_password_btn)
-
-        # Replace the password row
-        layout.removeRow(4)  # Remove the password row we just added
-        layout.insertRow(4, "Password:", password_layout)
+        layout.addRow("Password:", password_layout)
 
         # TOTP secret (hidden by default like password)
         self.totp_edit = QLineEdit()
@@ -88,16 +86,24 @@ class ConnectionForm(QWidget):
         self.totp_edit.setPlaceholderText("Base32 TOTP secret (from authenticator app setup)")
 
         # Show/hide TOTP button
-        self._totp_visible = False
         self.toggle_totp_btn = QPushButton("Show")
         self.toggle_totp_btn.setFixedWidth(60)
-        self.toggle_totp_btn.clicked.connect(self._toggle_totp_visibility)
+        self.toggle_totp_btn.clicked.connect(
+            partial(self._toggle_echo, self.totp_edit, self.toggle_totp_btn)
+        )
 
         totp_layout = QHBoxLayout()
         totp_layout.addWidget(self.totp_edit)
         totp_layout.addWidget(self.toggle_totp_btn)
         layout.addRow("TOTP Secret:", totp_layout)
 
+        # Validate the secret once typing pauses, not on every keystroke
+        self._totp_debounce = QTimer(self)
+        self._totp_debounce.setSingleShot(True)
+        self._totp_debounce.setInterval(250)
+        self._totp_debounce.timeout.connect(self._live_validate_totp)
+        self.totp_edit.textChanged.connect(self._totp_debounce.start)
+
         # TOTP test section
         test_layout = QHBoxLayout()
         self.totp_test_btn = QPushButton("Test TOTP")
@@ -119,25 +125,22 @@ class ConnectionForm(QWidget):
         btn_layout.addWidget(self.save_btn)
         layout.addRow("", btn_layout)
 
-    def _toggle_password_visibility(self) -> None:
-        """Toggle password field visibility."""
-        self._password_visible = not self._password_visible
-        if self._password_visible:
-            self.password_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_password_btn.setText("Hide")
-        else:
-            self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_password_btn.setText("Show")
-
-    def _toggle_totp_visibility(self) -> None:
-        """Toggle TOTP secret field visibility."""
-        self._totp_visible = not self._totp_visible
-        if self._totp_visible:
-            self.totp_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_totp_btn.setText("Hide")
+    def _toggle_echo(
+        self, edit: QLineEdit, btn: QPushButton, checked: bool = False
+    ) -> None:
+        """Toggle a secret field between hidden and visible.
+
+        Args:
+            edit: Line edit to toggle
+            btn: Its Show/Hide button
+            checked: Unused QPushButton.clicked argument
+        """
+        if edit.echoMode() == QLineEdit.EchoMode.Normal:
+            edit.setEchoMode(QLineEdit.EchoMode.Password)
+            btn.setText("Show")
         else:
-            self.totp_edit.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_totp_btn.setText("Show")
+            edit.setEchoMode(QLineEdit.EchoMode.Normal)
+            btn.setText("Hide")
 
     def load_connection(self, name: str, conn: dict) -> None:
         """Load a connection into the form for editing.
@@ -154,7 +157,7 @@ class ConnectionForm(QWidget):
         self.address_edit.setText(conn.get("address", ""))
 
         protocol = conn.get("protocol", "anyconnect")
-        idx = self.protocol_combo.findData(protocol)
+        idx = self.protocol_combo.findData(protocol, Qt.ItemDataRole.UserRole)
         if idx >= 0:
             self.protocol_combo.setCurrentIndex(idx)
 
@@ -185,29 +188,53 @@ class ConnectionForm(QWidget):
 
     def _test_totp(self) -> None:
         """Test the TOTP secret by generating a code."""
-        secret = self.totp_edit.text().strip().replace(" ", "").upper()
+        secret = self.backend.normalize_totp_secret(self.totp_edit.text())
 
         if not secret:
             self.totp_result_label.setText("No secret entered")
             self.totp_result_label.setStyleSheet("color: orange;")
             return
 
-        try:
-            code = self.backend.generate_totp(secret)
-            self.totp_result_label.setText(f"Current code: {code}")
-            self.totp_result_label.setStyleSheet("color: green;")
-        except Exception as e:
-            self.totp_result_label.setText(f"Invalid: {e}")
-            self.totp_result_label.setStyleSheet("color: red;")
+        error = self.backend.totp_secret_error(secret)
+        if error:
+            self._on_totp_error(error)
+            return
+
+        # Generate off the GUI thread; the button is re-enabled by the callbacks
+        self.totp_test_btn.setEnabled(False)
+        run_in_background(
+            self.backend.generate_totp,
+            secret,
+            on_result=self._on_totp_result,
+            on_error=self._on_totp_error,
+        )
+
+    def _live_validate_totp(self) -> None:
+        """Mark the TOTP field red while it can't be a Base32 secret."""
+        secret = self.backend.normalize_totp_secret(self.totp_edit.text())
+        valid = self.backend.totp_secret_error(secret) is None
+        self.totp_edit.setStyleSheet("" if valid else "color: red;")
+
+    def _on_totp_result(self, code: str) -> None:
+        """Show the generated TOTP code."""
+        self.totp_test_btn.setEnabled(True)
+        self.totp_result_label.setText(f"Current code: {code}")
+        self.totp_result_label.setStyleSheet("color: green;")
+
+    def _on_totp_error(self, message: str) -> None:
+        """Show why the TOTP secret could not be used."""
+        self.totp_test_btn.setEnabled(True)
+        self.totp_result_label.setText(f"Invalid: {message}")
+        self.totp_result_label.setStyleSheet("color: red;")
 
     def _save(self) -> None:
         """Save the connection."""
         name = self.name_edit.text().strip()
         address = self.address_edit.text().strip()
-        protocol = self.protocol_combo.currentData()
+        protocol = self.protocol_combo.currentData(Qt.ItemDataRole.UserRole)
         username = self.username_edit.text().strip()
         password = self.password_edit.text()
-        totp_secret = self.totp_edit.text().strip().replace(" ", "").upper()
+        totp_secret = self.backend.normalize_totp_secret(self.totp_edit.text())
 
         # Validation
         errors = []
@@ -231,13 +258,12 @@ class ConnectionForm(QWidget):
             return
 
         # Validate TOTP secret
-        try:
-            self.backend.generate_totp(totp_secret)
-        except Exception as e:
+        error = self.backend.totp_secret_error(totp_secret)
+        if error:
             QMessageBox.warning(
                 self,
                 "Invalid TOTP Secret",
-                f"The TOTP secret is invalid:\n{e}\n\n"
+                f"The TOTP secret is invalid:\n{error}\n\n"
                 "Please enter a valid Base32-encoded secret."
             )
             return
@@ -2,9 +2,11 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QStandardItem, QStandardItemModel
 
 # Application info
 APP_NAME = "MS SSO OpenConnect"
@@ -32,7 +34,8 @@ else:
     STATE_DIR = Path.home() / ".cache" / "ms-sso-openconnect-ui"
     LOGS_DIR = Path.home() / ".local" / "share" / "ms-sso-openconnect-ui" / "logs"
 
-STATE_FILE = STATE_DIR / "state.json"
+# Plain text: the name of the active connection
+STATE_FILE = STATE_DIR / "active_connection"
 
 # Status constants
 STATUS_DISCONNECTED = "disconnected"
@@ -46,9 +49,41 @@ PROTOCOLS = {
 }
 
 
+@lru_cache(maxsize=1)
+def get_protocol_model() -> QStandardItemModel:
+    """Get the shared protocol model for combo boxes.
+
+    Rows show the protocol name and carry the protocol id as
+    Qt.ItemDataRole.UserRole. Selection state lives on each combo box,
+    so one model can back all of them.
+
+    Returns:
+        QStandardItemModel instance
+    """
+    model = QStandardItemModel()
+    for proto_id, proto_info in PROTOCOLS.items():
+        item = QStandardItem(proto_info["name"])
+        item.setData(proto_id, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    return model
+
+
+# Fallback mappings to system icons
+_ICON_FALLBACKS = {
+    "vpn-connected": "network-vpn-symbolic",
+    "vpn-disconnected": "network-vpn-disconnected-symbolic",
+    "vpn-connecting": "network-vpn-acquiring-symbolic",
+    "app-icon": "network-vpn",
+}
+
+
+@lru_cache(maxsize=None)
 def get_icon(name: str) -> QIcon:
     """Get an icon, trying bundled resources first, then system icons.
 
+    Results are cached per name, so the file probes and theme lookups
+    only happen once. Requires a QApplication to exist.
+
     Args:
         name: Icon name (without extension)
 
@@ -66,16 +101,8 @@ def get_icon(name: str) -> QIcon:
     if not icon.isNull():
         return icon
 
-    # Fallback mappings to system icons
-    fallbacks = {
-        "vpn-connected": "network-vpn-symbolic",
-        "vpn-disconnected": "network-vpn-disconnected-symbolic",
-        "vpn-connecting": "network-vpn-acquiring-symbolic",
-        "app-icon": "network-vpn",
-    }
-
-    if name in fallbacks:
-        icon = QIcon.fromTheme(fallbacks[name])
+    if name in _ICON_FALLBACKS:
+        icon = QIcon.fromTheme(_ICON_FALLBACKS[name])
         if not icon.isNull():
             return icon
 
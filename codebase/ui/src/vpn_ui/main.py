@@ -62,6 +62,7 @@ class VPNApplication:
         self._current_connection: Optional[str] = None
         self._settings_dialog: Optional[SettingsDialog] = None
         self._disconnecting: bool = False  # Flag to suppress errors during disconnect
+        self._connections_cache: dict = {}  # Refreshed by _update_connections_menu
 
         # Check system tray availability
         if not VPNTrayIcon.is_system_tray_available():
@@ -91,7 +92,8 @@ class VPNApplication:
         # Load connections into tray menu
         self._update_connections_menu()
 
-        # Check current connection status
+    def _check_initial_status(self) -> None:
+        """Pick up a VPN connection that was already running at startup."""
         if self.backend.is_connected():
             # Try to get the connection name from state file
             active_conn = self.backend.get_active_connection()
@@ -124,18 +126,21 @@ class VPNApplication:
         # Start status polling
         self.tray.start_status_polling()
 
+        # Check for an existing connection once the event loop is running,
+        # so a slow or missing daemon doesn't delay the tray icon
+        QTimer.singleShot(0, self._check_initial_status)
+
         # If no connections exist, show settings dialog
-        connections = self.backend.get_connections()
-        if not connections:
+        if not self._connections_cache:
             self._show_settings()
 
         # Run event loop
         return self.app.exec()
 
     def _update_connections_menu(self) -> None:
-        """Update the connections menu in the tray."""
-        connections = self.backend.get_connections()
-        self.tray.update_connections(connections)
+        """Reload connections and update the tray menu."""
+        self._connections_cache = self.backend.get_connections()
+        self.tray.update_connections(self._connections_cache)
 
     def _show_settings(self) -> None:
         """Show the settings dialog."""
@@ -4,13 +4,28 @@
 - macOS: Uses LaunchAgent plist files in ~/Library/LaunchAgents/
 """
 
+import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from vpn_ui.constants import APP_ID, APP_NAME
 
 
+def _write_atomic(path: Path, data: bytes, mode: int) -> None:
+    """Write a file via a temp file and rename, so readers never see it half-written."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
 if sys.platform == "darwin":
     # ==========================================================================
     # macOS Implementation - LaunchAgent
@@ -19,27 +34,26 @@ if sys.platform == "darwin":
 
     LAUNCH_AGENTS_DIR = Path.home() / "Library" / "LaunchAgents"
     AUTOSTART_FILE = LAUNCH_AGENTS_DIR / f"{APP_ID}.plist"
+    LAUNCHCTL = "/bin/launchctl"
 
+    @lru_cache(maxsize=1)
     def _find_executable() -> str:
-        """Find the executable path for the application."""
-        # Check if running from .app bundle
-        app_bundle_paths = [
-            Path("/Applications/MS SSO OpenConnect.app/Contents/MacOS/ms-sso-openconnect-ui"),
-            Path.home() / "Applications/MS SSO OpenConnect.app/Contents/MacOS/ms-sso-openconnect-ui",
-        ]
-
-        for path in app_bundle_paths:
-            if path.exists():
-                return str(path)
-
-        # Check standard install paths
-        installed_paths = [
+        """Find the executable path for the application.
+
+        The result is cached, since the install location doesn't change
+        while the application is running.
+        """
+        candidates = [
+            # .app bundle
+            "/Applications/MS SSO OpenConnect.app/Contents/MacOS/ms-sso-openconnect-ui",
+            os.path.expanduser("~/Applications/MS SSO OpenConnect.app/Contents/MacOS/ms-sso-openconnect-ui"),
+            # Standard install paths
             "/usr/local/bin/ms-sso-openconnect-ui",
-            str(Path.home() / ".local/bin/ms-sso-openconnect-ui"),
+            os.path.expanduser("~/.local/bin/ms-sso-openconnect-ui"),
         ]
 
-        for path in installed_paths:
-            if Path(path).exists():
+        for path in candidates:
+            if os.path.exists(path):
                 return path
 
         return "ms-sso-openconnect-ui"
@@ -59,9 +73,14 @@ if sys.platform == "darwin":
             "StandardErrorPath": str(Path.home() / "Library/Logs" / f"{APP_ID}.error.log"),
         }
 
+    @lru_cache(maxsize=1)
+    def _launch_agent_plist_bytes() -> bytes:
+        """Serialized LaunchAgent plist (constant for the process lifetime)."""
+        return plistlib.dumps(_create_launch_agent_plist())
+
     def is_autostart_enabled() -> bool:
         """Check if autostart is currently enabled."""
-        return AUTOSTART_FILE.exists()
+        return os.path.isfile(AUTOSTART_FILE)
 
     def enable_autostart() -> bool:
         """Enable autostart for the application."""
@@ -70,11 +89,13 @@ if sys.platform == "darwin":
             logs_dir = Path.home() / "Library/Logs"
             logs_dir.mkdir(parents=True, exist_ok=True)
 
-            plist_data = _create_launch_agent_plist()
-            with open(AUTOSTART_FILE, "wb") as f:
-                plistlib.dump(plist_data, f)
+            _write_atomic(AUTOSTART_FILE, _launch_agent_plist_bytes(), 0o644)
 
-            subprocess.run(["launchctl", "load", str(AUTOSTART_FILE)], capture_output=True)
+            subprocess.run(
+                [LAUNCHCTL, "load", str(AUTOSTART_FILE)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             return True
         except Exception as e:
             print(f"Failed to enable autostart: {e}", file=sys.stderr)
@@ -84,7 +105,11 @@ if sys.platform == "darwin":
         """Disable autostart for the application."""
         try:
             if AUTOSTART_FILE.exists():
-                subprocess.run(["launchctl", "unload", str(AUTOSTART_FILE)], capture_output=True)
+                subprocess.run(
+                    [LAUNCHCTL, "unload", str(AUTOSTART_FILE)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
                 AUTOSTART_FILE.unlink()
             return True
         except Exception as e:
@@ -95,7 +120,7 @@ else:
     # ==========================================================================
     # Linux Implementation - XDG Desktop Entry
     # ==========================================================================
-    import os
+    import re
 
     AUTOSTART_DIR = Path.home() / ".config" / "autostart"
     AUTOSTART_FILE = AUTOSTART_DIR / f"{APP_ID}.desktop"
@@ -115,56 +140,65 @@ StartupNotify=false
 NoDisplay=false
 """
 
+    # Desktop entry lines that turn autostart off (matched on lowercased bytes)
+    _DISABLED_RE = re.compile(rb"^\s*(?:x-gnome-autostart-enabled=false|hidden=true)\s*$", re.M)
+
+    @lru_cache(maxsize=1)
     def _find_executable() -> str:
-        """Find the executable path for the application."""
+        """Find the executable path for the application.
+
+        The result is cached, since the install location doesn't change
+        while the application is running.
+        """
         installed_paths = [
             "/usr/bin/ms-sso-openconnect-ui",
             "/usr/local/bin/ms-sso-openconnect-ui",
-            str(Path.home() / ".local/bin/ms-sso-openconnect-ui"),
+            os.path.expanduser("~/.local/bin/ms-sso-openconnect-ui"),
         ]
 
         for path in installed_paths:
-            if Path(path).exists():
+            if os.path.exists(path):
                 return path
 
         # Check if running as AppImage
         appimage_path = os.environ.get("APPIMAGE")
-        if appimage_path and Path(appimage_path).exists():
+        if appimage_path and os.path.exists(appimage_path):
             return appimage_path
 
         return "ms-sso-openconnect-ui"
 
-    def is_autostart_enabled() -> bool:
-        """Check if autostart is currently enabled."""
-        if not AUTOSTART_FILE.exists():
+    @lru_cache(maxsize=1)
+    def _desktop_entry_bytes() -> bytes:
+        """Rendered desktop entry (constant for the process lifetime)."""
+        return DESKTOP_TEMPLATE.format(
+            name=APP_NAME,
+            exec_path=_find_executable(),
+            app_id=APP_ID,
+        ).encode("utf-8")
+
+    @lru_cache(maxsize=1)
+    def _read_autostart_enabled(mtime_ns: int) -> bool:
+        """Parse the desktop entry; cached per file modification time."""
+        try:
+            content = AUTOSTART_FILE.read_bytes().lower()
+        except OSError:
             return False
+        return _DISABLED_RE.search(content) is None
 
+    def is_autostart_enabled() -> bool:
+        """Check if autostart is currently enabled."""
         try:
-            content = AUTOSTART_FILE.read_text()
-            for line in content.splitlines():
-                line = line.strip().lower()
-                if line == "x-gnome-autostart-enabled=false":
-                    return False
-                if line == "hidden=true":
-                    return False
-            return True
-        except Exception:
+            mtime_ns = AUTOSTART_FILE.stat().st_mtime_ns
+        except OSError:
             return False
+        return _read_autostart_enabled(mtime_ns)
 
     def enable_autostart() -> bool:
         """Enable autostart for the application."""
         try:
             AUTOSTART_DIR.mkdir(parents=True, exist_ok=True)
-            exec_path = _find_executable()
-
-            content = DESKTOP_TEMPLATE.format(
-                name=APP_NAME,
-                exec_path=exec_path,
-                app_id=APP_ID,
-            )
-
-            AUTOSTART_FILE.write_text(content)
-            AUTOSTART_FILE.chmod(0o755)
+            _write_atomic(AUTOSTART_FILE, _desktop_entry_bytes(), 0o755)
+            _read_autostart_enabled.cache_clear()
             return True
         except Exception as e:
             print(f"Failed to enable autostart: {e}", file=sys.stderr)
@@ -175,6 +209,7 @@ NoDisplay=false
         try:
             if AUTOSTART_FILE.exists():
                 AUTOSTART_FILE.unlink()
+            _read_autostart_enabled.cache_clear()
             return True
         except Exception as e:
             print(f"Failed to disable autostart: {e}", file=sys.stderr)
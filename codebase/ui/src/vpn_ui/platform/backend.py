@@ -7,8 +7,15 @@ implementations for connecting, disconnecting, and checking VPN status.
 - macOS: Uses daemon IPC for privilege escalation, SIGTERM for graceful disconnect
 """
 
+import json
+import os
+import shlex
+import signal
+import socket
 import subprocess
 import sys
+import threading
+import time
 from typing import Optional
 
 from vpn_ui.backend.shared import SharedBackendMixin, core_connect_vpn
@@ -18,6 +25,31 @@ if sys.platform == "darwin":
     # macOS-specific imports and constants
     DAEMON_SOCKET = "/var/run/ms-sso-openconnect/daemon.sock"
 
+    # Retry transient socket errors (daemon restarting, listen backlog full)
+    DAEMON_RETRIES = 3
+    DAEMON_RETRY_BASE = 0.1  # seconds, doubled per attempt
+    DAEMON_RETRY_CAP = 2.0
+    _TRANSIENT_SOCKET_ERRORS = (ConnectionRefusedError, ConnectionResetError, BrokenPipeError)
+
+    # How long a daemon ping result is reused (seconds)
+    DAEMON_PROBE_TTL = 1.0
+
+    OSASCRIPT = "/usr/bin/osascript"
+
+    def _admin_shell_command(shell_cmd: str) -> list:
+        """osascript argv that runs shell_cmd with administrator privileges.
+
+        The command is passed as a script argument rather than spliced into
+        an AppleScript string literal, so it needs no AppleScript escaping.
+        """
+        return [
+            OSASCRIPT,
+            "-e", "on run argv",
+            "-e", "do shell script (item 1 of argv) with administrator privileges",
+            "-e", "end run",
+            shell_cmd,
+        ]
+
 
 class VPNBackend(SharedBackendMixin):
     """Platform-specific VPN backend.
@@ -31,57 +63,151 @@ class VPNBackend(SharedBackendMixin):
 
     def __init__(self):
         """Initialize the backend."""
-        pass
+        if sys.platform == "darwin":
+            # Persistent daemon connection, reused across requests
+            self._daemon_lock = threading.Lock()
+            self._daemon_sock: Optional[socket.socket] = None
+            self._daemon_reader = None
+            self._daemon_probe = (float("-inf"), False)  # (monotonic time, available)
+
+        # Warm the keyring backend (and the connection cache) now rather
+        # than on the first Connect
+        self.get_connections()
 
     if sys.platform == "darwin":
         # =====================================================================
         # macOS Implementation - Uses daemon IPC
         # =====================================================================
 
-        def _daemon_request(self, method: str, params: dict = None) -> dict:
+        def _daemon_request(
+            self,
+            method: str,
+            params: dict = None,
+            timeout: float = 30,
+            retries: int = DAEMON_RETRIES,
+        ) -> dict:
             """Send a request to the VPN daemon.
 
+            ping and status are frequent and safe to resend, so they share one
+            persistent connection. connect and disconnect use a connection of
+            their own and are never resent once sent, since the daemon may
+            already have acted on them. Transient socket errors are otherwise
+            retried with exponential backoff. A missing socket means the
+            daemon is not installed/running and fails immediately.
+
             Args:
                 method: RPC method name
                 params: Optional parameters
+                timeout: Socket timeout in seconds
+                retries: Retries for transient errors
 
             Returns:
                 Response dict with 'result' or 'error'
             """
-            import json
-            import socket
-
             request = {
                 "jsonrpc": "2.0",
                 "method": method,
                 "params": params or {},
                 "id": 1
             }
-
+            payload = json.dumps(request).encode() + b"\n"
+            shared = method in ("ping", "status")
+
+            for attempt in range(retries + 1):
+                sent = False
+                try:
+                    if shared:
+                        with self._daemon_lock:
+                            return self._daemon_shared_request(payload, timeout)
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                        sock.settimeout(timeout)
+                        sock.connect(DAEMON_SOCKET)
+                        sock.sendall(payload)
+                        sent = True
+                        with sock.makefile("rb") as reader:
+                            return self._daemon_read_response(reader)
+                except FileNotFoundError:
+                    return {"error": {"code": -1, "message": "Daemon not running"}}
+                except _TRANSIENT_SOCKET_ERRORS as e:
+                    if sent or attempt == retries:
+                        return {"error": {"code": -1, "message": str(e)}}
+                except Exception as e:
+                    return {"error": {"code": -1, "message": str(e)}}
+                # Back off without holding the lock
+                time.sleep(min(DAEMON_RETRY_CAP, DAEMON_RETRY_BASE * (2 ** attempt)))
+
+        def _daemon_shared_request(self, payload: bytes, timeout: float) -> dict:
+            """Send payload on the persistent connection.
+
+            The caller holds _daemon_lock. If the daemon has dropped the
+            connection as idle, it is replaced once right away.
+            """
+            reused = self._daemon_sock is not None
+            while True:
+                if self._daemon_sock is None:
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    try:
+                        sock.settimeout(timeout)
+                        sock.connect(DAEMON_SOCKET)
+                    except BaseException:
+                        sock.close()
+                        raise
+                    self._daemon_sock, self._daemon_reader = sock, sock.makefile("rb")
+                try:
+                    self._daemon_sock.settimeout(timeout)
+                    self._daemon_sock.sendall(payload)
+                    return self._daemon_read_response(self._daemon_reader)
+                except ConnectionError:
+                    self._daemon_close()
+                    if not reused:
+                        raise
+                    reused = False
+                except BaseException:
+                    self._daemon_close()
+                    raise
+
+        @staticmethod
+        def _daemon_read_response(reader) -> dict:
+            """Read one newline-terminated JSON response from the daemon."""
+            line = reader.readline()
+            if not line:
+                raise ConnectionResetError("Daemon closed the connection")
+            return json.loads(line.decode())
+
+        def _daemon_close(self) -> None:
+            """Drop the persistent daemon connection."""
+            if self._daemon_sock is None:
+                return
             try:
-                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                sock.settimeout(30)
-                sock.connect(DAEMON_SOCKET)
-                sock.sendall(json.dumps(request).encode() + b"\n")
-                response = sock.recv(65536)
-                sock.close()
-                return json.loads(response.decode())
-            except FileNotFoundError:
-                return {"error": {"code": -1, "message": "Daemon not running"}}
-            except Exception as e:
-                return {"error": {"code": -1, "message": str(e)}}
+                self._daemon_reader.close()
+                self._daemon_sock.close()
+            except OSError:
+                pass
+            self._daemon_sock = None
+            self._daemon_reader = None
 
         def _is_daemon_available(self) -> bool:
-            """Check if the daemon is running and responsive."""
+            """Check if the daemon is running and responsive.
+
+            The answer is reused for DAEMON_PROBE_TTL seconds, so back-to-back
+            operations (e.g. disconnect then reconnect) ping only once.
+            """
+            probed_at, available = self._daemon_probe
+            now = time.monotonic()
+            if now - probed_at < DAEMON_PROBE_TTL:
+                return available
+
             try:
-                result = self._daemon_request("ping")
-                return "result" in result and result["result"].get("pong")
+                # A local daemon answers ping immediately; don't wait long
+                result = self._daemon_request("ping", timeout=0.5, retries=0)
+                available = bool("result" in result and result["result"].get("pong"))
             except Exception:
-                return False
+                available = False
+            self._daemon_probe = (now, available)
+            return available
 
         def _find_openconnect(self) -> Optional[str]:
             """Find openconnect binary path."""
-            import os
             for path in ["/opt/homebrew/bin/openconnect", "/usr/local/bin/openconnect", "/usr/bin/openconnect"]:
                 if os.path.exists(path):
                     return path
@@ -99,8 +225,6 @@ class VPNBackend(SharedBackendMixin):
 
             This is used when the daemon is not available.
             """
-            import shlex
-
             openconnect_bin = self._find_openconnect()
             if not openconnect_bin:
                 print("[Error] openconnect not found")
@@ -146,23 +270,16 @@ class VPNBackend(SharedBackendMixin):
                 cmd_str = " ".join(shlex.quote(p) for p in cmd_parts)
                 shell_cmd = cmd_str
 
-            # Escape for AppleScript (backslash-escape quotes and backslashes)
-            shell_cmd_escaped = shell_cmd.replace("\\", "\\\\").replace('"', '\\"')
-
-            # Wrap in osascript for admin privileges
-            script = f'do shell script "{shell_cmd_escaped}" with administrator privileges'
-
             try:
                 print(f"[Fallback] Connecting via osascript...")
                 print(f"[Fallback] Command: {cmd_str}")
                 result = subprocess.Popen(
-                    ["osascript", "-e", script],
+                    _admin_shell_command(shell_cmd),
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                 )
                 # Don't wait - openconnect runs in foreground
                 # Give it a moment to start
-                import time
                 time.sleep(3)
 
                 # Check if it's running
@@ -199,26 +316,29 @@ class VPNBackend(SharedBackendMixin):
             The daemon runs as root and manages openconnect, eliminating
             the need for per-connection sudo prompts.
             """
-            if self._is_daemon_available():
-                # Use daemon for connection
-                result = self._daemon_request("connect", {
-                    "address": address,
-                    "protocol": protocol,
-                    "cookies": cookies,
-                    "no_dtls": no_dtls,
-                    "username": username,
-                    "connection_name": connection_name,
-                    "cached_usergroup": cached_usergroup,
-                })
-                if "result" in result:
-                    return result["result"].get("success", False)
-                # Daemon returned error, fall back to direct connection
-                print(f"[Daemon error] {result.get('error', {}).get('message', 'Unknown')}")
-
-            # Fallback: direct connection with osascript for admin privileges
-            return self._connect_with_osascript(
-                address, protocol, cookies, no_dtls, username
-            )
+            try:
+                if self._is_daemon_available():
+                    # Use daemon for connection
+                    result = self._daemon_request("connect", {
+                        "address": address,
+                        "protocol": protocol,
+                        "cookies": cookies,
+                        "no_dtls": no_dtls,
+                        "username": username,
+                        "connection_name": connection_name,
+                        "cached_usergroup": cached_usergroup,
+                    })
+                    if "result" in result:
+                        return result["result"].get("success", False)
+                    # Daemon returned error, fall back to direct connection
+                    print(f"[Daemon error] {result.get('error', {}).get('message', 'Unknown')}")
+
+                # Fallback: direct connection with osascript for admin privileges
+                return self._connect_with_osascript(
+                    address, protocol, cookies, no_dtls, username
+                )
+            finally:
+                self.invalidate_process_cache()
 
         def disconnect(self, force: bool = False) -> bool:
             """Disconnect from VPN via daemon IPC (macOS).
@@ -230,56 +350,61 @@ class VPNBackend(SharedBackendMixin):
                 force: If True, also terminates the session. On macOS, the
                        signal is always SIGTERM (graceful) regardless.
             """
-            if self._is_daemon_available():
-                result = self._daemon_request("disconnect", {"force": force})
-                if "result" in result:
-                    success = result["result"].get("success", False)
-                    if success and force:
-                        self.clear_stored_cookies()
-                    return success
-
-            # Fallback: use osascript for admin privileges
-            # IMPORTANT: Always use SIGTERM on macOS for graceful shutdown
             try:
-                script = 'do shell script "pkill -TERM -x openconnect" with administrator privileges'
-                result = subprocess.run(
-                    ["osascript", "-e", script],
-                    capture_output=True,
-                    timeout=60
-                )
-                if result.returncode == 0:
-                    if force:
-                        self.clear_stored_cookies()
-                    return True
-
-                # Try killall as alternative
-                script = 'do shell script "killall -TERM openconnect" with administrator privileges'
-                result = subprocess.run(
-                    ["osascript", "-e", script],
-                    capture_output=True,
-                    timeout=60
-                )
-                return result.returncode == 0
-            except Exception:
-                return False
+                if self._is_daemon_available():
+                    result = self._daemon_request("disconnect", {"force": force})
+                    if "result" in result:
+                        success = result["result"].get("success", False)
+                        if success and force:
+                            self.clear_stored_cookies()
+                        return success
+
+                # Fallback: signal openconnect ourselves, or via osascript
+                # for admin privileges if it runs as root
+                # IMPORTANT: Always use SIGTERM on macOS for graceful shutdown
+                try:
+                    signalled = self._signal_openconnect(signal.SIGTERM)
+                    if signalled is not None:
+                        if signalled and force:
+                            self.clear_stored_cookies()
+                        return signalled
+
+                    # One admin prompt: killall only runs if pkill fails
+                    result = subprocess.run(
+                        _admin_shell_command(
+                            "pkill -TERM -x openconnect || killall -TERM openconnect"
+                        ),
+                        capture_output=True,
+                        timeout=60
+                    )
+                    if result.returncode == 0:
+                        if force:
+                            self.clear_stored_cookies()
+                        return True
+                    return False
+                except Exception:
+                    return False
+            finally:
+                self.invalidate_process_cache()
 
         def is_connected(self) -> bool:
             """Check if VPN is connected (macOS)."""
-            if self._is_daemon_available():
-                result = self._daemon_request("status")
-                if "result" in result:
-                    return result["result"].get("connected", False)
+            # Ask for status directly; a failed request falls through to
+            # pgrep, so a separate ping round-trip buys nothing here.
+            result = self._daemon_request("status", timeout=2, retries=0)
+            if "result" in result:
+                return result["result"].get("connected", False)
 
             # Fallback: check process directly
-            try:
-                result = subprocess.run(
-                    ["pgrep", "-x", "openconnect"],
-                    capture_output=True,
-                    text=True
-                )
-                return result.returncode == 0
-            except Exception:
-                return False
+            return self._openconnect_running()
+
+        def get_openconnect_pid(self) -> Optional[int]:
+            """Get the openconnect PID (macOS).
+
+            Not needed here: the UI only uses it to watch for process exit
+            via pidfd, which is Linux-only.
+            """
+            return None
 
     else:
         # =====================================================================
@@ -302,11 +427,14 @@ class VPNBackend(SharedBackendMixin):
             Uses pkexec (PolicyKit) for privilege escalation which shows
             a graphical password prompt.
             """
-            return core_connect_vpn(
-                address, protocol, cookies, no_dtls, username,
-                allow_fallback, connection_name, cached_usergroup,
-                use_pkexec=True  # Use pkexec for GUI (no terminal needed)
-            )
+            try:
+                return core_connect_vpn(
+                    address, protocol, cookies, no_dtls, username,
+                    allow_fallback, connection_name, cached_usergroup,
+                    use_pkexec=True  # Use pkexec for GUI (no terminal needed)
+                )
+            finally:
+                self.invalidate_process_cache()
 
         def disconnect(self, force: bool = False) -> bool:
             """Disconnect from VPN using pkexec (Linux).
@@ -316,6 +444,17 @@ class VPNBackend(SharedBackendMixin):
                        If False, send SIGKILL (keep session alive for reconnect).
             """
             try:
+                # Signal directly when we may (same user or CAP_KILL); only
+                # escalate through polkit when the kernel says no, or when
+                # hidepid may have hidden root's openconnect from the scan.
+                signalled = self._signal_openconnect(
+                    signal.SIGTERM if force else signal.SIGKILL
+                )
+                if signalled is not None:
+                    if signalled and force:
+                        self.clear_stored_cookies()
+                    return signalled
+
                 # IMPORTANT: Use -x for exact process name match
                 # -f would match paths containing "openconnect" and kill the UI
                 signal_flag = "-TERM" if force else "-KILL"
@@ -336,16 +475,14 @@ class VPNBackend(SharedBackendMixin):
                 return result.returncode == 0
             except Exception:
                 return False
+            finally:
+                self.invalidate_process_cache()
 
         def is_connected(self) -> bool:
             """Check if VPN is connected (Linux)."""
-            try:
-                # Use pgrep -x for exact process name match
-                result = subprocess.run(
-                    ["pgrep", "-x", "openconnect"],
-                    capture_output=True,
-                    text=True
-                )
-                return result.returncode == 0
-            except Exception:
-                return False
+            return self._openconnect_running()
+
+        def get_openconnect_pid(self) -> Optional[int]:
+            """Get the openconnect PID (Linux)."""
+            # Newest (highest PID), in case a stale instance is still exiting
+            return max(self._probe_openconnect(), default=None)
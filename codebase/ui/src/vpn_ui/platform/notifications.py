@@ -7,8 +7,12 @@
 import subprocess
 import sys
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QSystemTrayIcon
 
+# Notifications queued within this window are coalesced per title
+COALESCE_MS = 100
+
 
 class NotificationManager:
     """Manages desktop notifications via system tray or native APIs."""
@@ -23,6 +27,13 @@ class NotificationManager:
         self._notifications_enabled = True
         self._use_native = sys.platform == "darwin"
 
+        # Pending notifications: title -> (message, critical, duration_ms)
+        self._pending: dict[str, tuple[str, bool, int]] = {}
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(COALESCE_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
     def set_enabled(self, enabled: bool) -> None:
         """Enable or disable notifications.
 
@@ -64,6 +75,10 @@ class NotificationManager:
     ) -> None:
         """Show a desktop notification.
 
+        Regular notifications are delayed briefly so a burst with the same
+        title only shows the last one. Critical notifications are shown
+        immediately (after any pending ones).
+
         Args:
             title: Notification title
             message: Notification message
@@ -73,6 +88,29 @@ class NotificationManager:
         if not self._notifications_enabled:
             return
 
+        if critical:
+            self._flush()
+            self._deliver(title, message, critical, duration_ms)
+            return
+
+        self._pending[title] = (message, critical, duration_ms)
+        self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Show all pending notifications."""
+        self._flush_timer.stop()
+        pending, self._pending = self._pending, {}
+        for title, (message, critical, duration_ms) in pending.items():
+            self._deliver(title, message, critical, duration_ms)
+
+    def _deliver(
+        self,
+        title: str,
+        message: str,
+        critical: bool,
+        duration_ms: int
+    ) -> None:
+        """Hand a notification to the native API or the tray icon."""
         # Try native macOS notification first
         if self._use_native and sys.platform == "darwin":
             if self._show_native(title, message, sound=critical):
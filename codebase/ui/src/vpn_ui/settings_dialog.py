@@ -3,7 +3,7 @@
 import sys
 from typing import Optional
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -15,6 +15,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSplitter,
+    QStackedWidget,
     QTabWidget,
     QVBoxLayout,
     QWidget,
@@ -22,6 +23,7 @@ from PyQt6.QtWidgets import (
 
 from vpn_ui.connection_form import ConnectionForm
 from vpn_ui.constants import APP_NAME, PROTOCOLS
+from vpn_ui.worker import run_in_background
 
 # Platform-specific autostart import
 if sys.platform == "darwin":
@@ -45,13 +47,17 @@ class SettingsDialog(QDialog):
         """
         super().__init__(parent)
         self.backend = backend
+        self._connections_cache: dict = {}  # Refreshed by _load_connections
+        self._items_by_name: dict[str, QListWidgetItem] = {}
 
         self.setWindowTitle(f"{APP_NAME} - Settings")
         self.setMinimumSize(700, 450)
         self.resize(800, 500)
 
+        # Built on first use of the Connections tab (see _ensure_form)
+        self.form_widget: Optional[ConnectionForm] = None
+
         self._setup_ui()
-        self._load_connections()
 
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
@@ -62,13 +68,15 @@ class SettingsDialog(QDialog):
         layout.addWidget(self.tab_widget)
 
         # Tab 1: Connections
-        connections_tab = self._create_connections_tab()
-        self.tab_widget.addTab(connections_tab, "Connections")
+        self._connections_tab = self._create_connections_tab()
+        self.tab_widget.addTab(self._connections_tab, "Connections")
 
         # Tab 2: Application Settings
         app_settings_tab = self._create_app_settings_tab()
         self.tab_widget.addTab(app_settings_tab, "Application")
 
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+
     def _create_connections_tab(self) -> QWidget:
         """Create the connections management tab.
 
@@ -118,10 +126,10 @@ class SettingsDialog(QDialog):
         self._form_header = QLabel("<b>Connection Details</b>")
         right_layout.addWidget(self._form_header)
 
-        # Form
-        self.form_widget = ConnectionForm(self.backend)
-        self.form_widget.saved.connect(self._on_saved)
-        right_layout.addWidget(self.form_widget)
+        # Form (placeholder until _ensure_form builds the real one)
+        self._form_stack = QStackedWidget()
+        self._form_stack.addWidget(QLabel("Loading..."))
+        right_layout.addWidget(self._form_stack)
 
         splitter.addWidget(right_widget)
 
@@ -132,6 +140,36 @@ class SettingsDialog(QDialog):
 
         return tab
 
+    def _ensure_form(self) -> None:
+        """Build the connection form and load the list on first use."""
+        if self.form_widget is not None:
+            return
+
+        self.form_widget = ConnectionForm(self.backend)
+        self.form_widget.saved.connect(self._on_saved)
+        self._form_stack.addWidget(self.form_widget)
+        self._form_stack.setCurrentWidget(self.form_widget)
+
+        self._load_connections()
+
+    def _on_tab_changed(self, index: int) -> None:
+        """Handle switching between settings tabs.
+
+        Args:
+            index: Index of the newly selected tab
+        """
+        if self.tab_widget.widget(index) is self._connections_tab:
+            self._ensure_form()
+
+    def showEvent(self, event) -> None:
+        """Build the form right after the dialog first appears."""
+        super().showEvent(event)
+        if (
+            self.form_widget is None
+            and self.tab_widget.currentWidget() is self._connections_tab
+        ):
+            QTimer.singleShot(0, self._ensure_form)
+
     def _create_app_settings_tab(self) -> QWidget:
         """Create the application settings tab.
 
@@ -150,8 +188,14 @@ class SettingsDialog(QDialog):
             "Launch the application automatically when you log into your desktop.\n"
             "The VPN will NOT connect automatically - only the tray icon will appear."
         )
-        self.autostart_checkbox.setChecked(is_autostart_enabled())
+        # Probe the autostart file off the GUI thread; enabled once known
+        self.autostart_checkbox.setEnabled(False)
         self.autostart_checkbox.stateChanged.connect(self._on_autostart_changed)
+        run_in_background(
+            is_autostart_enabled,
+            on_result=self._on_autostart_probed,
+            on_error=lambda _message: self.autostart_checkbox.setEnabled(True),
+        )
         startup_layout.addWidget(self.autostart_checkbox)
 
         # Add note about behavior
@@ -170,6 +214,17 @@ class SettingsDialog(QDialog):
 
         return tab
 
+    def _on_autostart_probed(self, enabled: bool) -> None:
+        """Show the current autostart state once it has been read.
+
+        Args:
+            enabled: Whether autostart is enabled
+        """
+        self.autostart_checkbox.blockSignals(True)
+        self.autostart_checkbox.setChecked(enabled)
+        self.autostart_checkbox.blockSignals(False)
+        self.autostart_checkbox.setEnabled(True)
+
     def _on_autostart_changed(self, state: int) -> None:
         """Handle autostart checkbox state change.
 
@@ -200,17 +255,19 @@ class SettingsDialog(QDialog):
     def _load_connections(self) -> None:
         """Load connections into the list."""
         self.connection_list.clear()
-        connections = self.backend.get_connections()
+        self._items_by_name.clear()
+        self._connections_cache = self.backend.get_connections()
 
-        for name, details in connections.items():
+        for name, details in self._connections_cache.items():
             protocol = details.get("protocol", "anyconnect")
             protocol_info = PROTOCOLS.get(protocol, PROTOCOLS["anyconnect"])
             protocol_name = protocol_info["name"]
 
             item = QListWidgetItem(f"{name}")
             item.setToolTip(f"{protocol_name}\n{details.get('address', '')}")
-            item.setData(256, name)  # Store name in item data
+            item.setData(Qt.ItemDataRole.UserRole, name)  # Store name in item data
             self.connection_list.addItem(item)
+            self._items_by_name[name] = item
 
         # Update form state
         if self.connection_list.count() == 0:
@@ -229,8 +286,8 @@ class SettingsDialog(QDialog):
             previous: Previously selected item
         """
         if current:
-            name = current.data(256)  # Get stored name
-            conn = self.backend.get_connection(name)
+            name = current.data(Qt.ItemDataRole.UserRole)  # Get stored name
+            conn = self._connections_cache.get(name)
             if conn:
                 self.form_widget.load_connection(name, conn)
                 self._form_header.setText(f"<b>Edit Connection: {name}</b>")
@@ -242,6 +299,7 @@ class SettingsDialog(QDialog):
 
     def _on_add(self) -> None:
         """Handle Add button click."""
+        self._ensure_form()
         self.connection_list.clearSelection()
         self.form_widget.new_connection()
         self._form_header.setText("<b>Add New Connection</b>")
@@ -253,7 +311,7 @@ class SettingsDialog(QDialog):
         if not current:
             return
 
-        name = current.data(256)
+        name = current.data(Qt.ItemDataRole.UserRole)
 
         reply = QMessageBox.question(
             self,
@@ -283,12 +341,9 @@ class SettingsDialog(QDialog):
 
         # Select the saved connection
         saved_name = self.form_widget.get_current_name()
-        if saved_name:
-            for i in range(self.connection_list.count()):
-                item = self.connection_list.item(i)
-                if item and item.data(256) == saved_name:
-                    self.connection_list.setCurrentItem(item)
-                    break
+        item = self._items_by_name.get(saved_name) if saved_name else None
+        if item:
+            self.connection_list.setCurrentItem(item)
 
         self.connections_changed.emit()
 
@@ -1,8 +1,10 @@
 """System tray icon and menu for VPN UI."""
 
+import os
+from functools import lru_cache
 from typing import Optional
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QSocketNotifier, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtWidgets import QMenu, QSystemTrayIcon
 
@@ -13,6 +15,34 @@ from vpn_ui.constants import (
     STATUS_DISCONNECTED,
     get_icon,
 )
+from vpn_ui.worker import run_in_background
+
+# Status polling: back off while idle (disconnected and unchanged)
+IDLE_POLL_INTERVAL_MS = 15000
+IDLE_POLLS_BEFORE_BACKOFF = 3
+# While openconnect's exit is watched via pidfd, polling is only a safety net
+WATCHED_POLL_INTERVAL_MS = 60000
+
+# Short protocol labels for the Connect submenu (anything else is AnyConnect)
+_PROTOCOL_LABELS = {"gp": "GP"}
+
+
+@lru_cache(maxsize=None)
+def _status_icons() -> dict[str, QIcon]:
+    """Build the status icon set once (needs a QApplication).
+
+    Falls back to the app icon for any status icon that is missing.
+    """
+    app_icon = get_icon("app-icon")
+    icons = {}
+    for status, name in (
+        (STATUS_DISCONNECTED, "vpn-disconnected"),
+        (STATUS_CONNECTING, "vpn-connecting"),
+        (STATUS_CONNECTED, "vpn-connected"),
+    ):
+        icon = get_icon(name)
+        icons[status] = app_icon if icon.isNull() else icon
+    return icons
 
 
 class VPNTrayIcon(QObject):
@@ -35,23 +65,28 @@ class VPNTrayIcon(QObject):
         self.tray = QSystemTrayIcon(parent)
         self.tray.setToolTip(APP_NAME)
 
+        # Last values pushed to the tray (each push re-sends to the host)
+        self._applied_status: Optional[str] = None
+        self._applied_tooltip = APP_NAME
+
         self._current_status = STATUS_DISCONNECTED
         self._current_connection: Optional[str] = None
         self._connections: dict = {}
+        self._connect_actions: dict[str, QAction] = {}
+        self._menu_snapshot: dict[str, str] = {}  # name -> protocol
+        self._backend = None  # Resolved on first poll
 
-        # Load icons
-        self._icons = {
-            STATUS_DISCONNECTED: get_icon("vpn-disconnected"),
-            STATUS_CONNECTING: get_icon("vpn-connecting"),
-            STATUS_CONNECTED: get_icon("vpn-connected"),
-        }
+        self._poll_interval_ms = 5000
+        self._idle_polls = 0
+        self._poll_in_flight = False
+        self._poll_dispatched: tuple = (None, None)  # (status, connection)
 
-        # Set app icon as fallback if no icons available
-        app_icon = get_icon("app-icon")
-        if not app_icon.isNull():
-            for status in [STATUS_DISCONNECTED, STATUS_CONNECTING, STATUS_CONNECTED]:
-                if self._icons[status].isNull():
-                    self._icons[status] = app_icon
+        # pidfd watch on the running openconnect (Linux)
+        self._pidfd: Optional[int] = None
+        self._pidfd_notifier: Optional[QSocketNotifier] = None
+
+        # Load icons (shared across instances)
+        self._icons = _status_icons()
 
         self._setup_menu()
         self._update_icon()
@@ -76,6 +111,8 @@ class VPNTrayIcon(QObject):
         # Connections submenu (populated dynamically)
         self._connections_menu = self.menu.addMenu("Connect")
         self._connections_menu.setEnabled(False)
+        # One dispatcher for all entries; each action carries its name in data()
+        self._connections_menu.triggered.connect(self._on_connect_triggered)
 
         # Disconnect action
         self._disconnect_action = self.menu.addAction("Disconnect")
@@ -121,23 +158,59 @@ class VPNTrayIcon(QObject):
         Args:
             connections: Dictionary of connection name -> details
         """
+        if connections == self._connections:
+            return
         self._connections = connections
-        self._connections_menu.clear()
+        self._connections_menu.setEnabled(bool(connections))
 
-        if not connections:
-            self._connections_menu.setEnabled(False)
+        # Only touch actions whose name or protocol label changed
+        snapshot = {
+            name: details.get("protocol", "anyconnect")
+            for name, details in connections.items()
+        }
+        if snapshot == self._menu_snapshot:
             return
 
-        self._connections_menu.setEnabled(True)
+        for name in self._menu_snapshot.keys() - snapshot.keys():
+            action = self._connect_actions.pop(name)
+            self._connections_menu.removeAction(action)
+            action.deleteLater()
+
+        # Kept entries only move if their relative order changed
+        kept = [name for name in snapshot if name in self._menu_snapshot]
+        reorder = kept != [name for name in self._menu_snapshot if name in snapshot]
+
+        # Walk backwards so each entry can be inserted before its successor,
+        # keeping the menu in saved-connection order
+        next_action = None
+        for name, protocol in reversed(snapshot.items()):
+            label = f"{name} ({_PROTOCOL_LABELS.get(protocol, 'AC')})"
+            action = self._connect_actions.get(name)
+            if action is None:
+                action = QAction(label, self._connections_menu)
+                action.setData(name)
+                self._connections_menu.insertAction(next_action, action)
+                self._connect_actions[name] = action
+            else:
+                if self._menu_snapshot[name] != protocol:
+                    action.setText(label)
+                if reorder:
+                    self._connections_menu.removeAction(action)
+                    self._connections_menu.insertAction(next_action, action)
+            next_action = action
+
+        self._menu_snapshot = snapshot
+
+    @pyqtSlot(QAction)
+    def _on_connect_triggered(self, action: QAction) -> None:
+        """Handle a connection entry being picked from the Connect submenu.
 
-        for name, details in connections.items():
-            protocol = details.get("protocol", "anyconnect")
-            protocol_name = "GP" if protocol == "gp" else "AC"
-            action = self._connections_menu.addAction(f"{name} ({protocol_name})")
-            # Use default argument to capture name correctly in lambda
-            action.triggered.connect(
-                lambda checked, n=name: self.connect_requested.emit(n)
-            )
+        Args:
+            action: The triggered action; its data() is the connection name
+        """
+        name = action.data()
+        if name:
+            self.connect_requested.emit(name)
 
     def set_status(
         self,
@@ -150,6 +223,10 @@ class VPNTrayIcon(QObject):
             status: One of STATUS_CONNECTED, STATUS_CONNECTING, STATUS_DISCONNECTED
             connection_name: Name of the current/connecting connection
         """
+        if status != self._current_status:
+            self._reset_poll_backoff()
+            if status != STATUS_CONNECTED:
+                self._unwatch_openconnect()
         self._current_status = status
         self._current_connection = connection_name
         self._update_icon()
@@ -158,17 +235,17 @@ class VPNTrayIcon(QObject):
             self._status_action.setText(f"Connected: {connection_name}")
             self.set_disconnect_enabled(True)
             self._connections_menu.setEnabled(False)
-            self.tray.setToolTip(f"{APP_NAME} - Connected to {connection_name}")
+            self._set_tooltip(f"{APP_NAME} - Connected to {connection_name}")
         elif status == STATUS_CONNECTING:
             self._status_action.setText(f"Connecting: {connection_name}...")
             self.set_disconnect_enabled(True)
             self._connections_menu.setEnabled(False)
-            self.tray.setToolTip(f"{APP_NAME} - Connecting to {connection_name}...")
+            self._set_tooltip(f"{APP_NAME} - Connecting to {connection_name}...")
         else:
             self._status_action.setText("Status: Disconnected")
             self.set_disconnect_enabled(False)
             self._connections_menu.setEnabled(bool(self._connections))
-            self.tray.setToolTip(f"{APP_NAME} - Disconnected")
+            self._set_tooltip(f"{APP_NAME} - Disconnected")
 
     def get_status(self) -> str:
         """Get current status.
@@ -200,8 +277,17 @@ class VPNTrayIcon(QObject):
 
     def _update_icon(self) -> None:
         """Update the tray icon based on current status."""
+        if self._current_status == self._applied_status:
+            return
         icon = self._icons.get(self._current_status, self._icons[STATUS_DISCONNECTED])
         self.tray.setIcon(icon)
+        self._applied_status = self._current_status
+
+    def _set_tooltip(self, text: str) -> None:
+        """Set the tray tooltip if it changed."""
+        if text != self._applied_tooltip:
+            self.tray.setToolTip(text)
+            self._applied_tooltip = text
 
     def start_status_polling(self, interval_ms: int = 5000) -> None:
         """Start polling for VPN connection status.
@@ -209,56 +295,168 @@ class VPNTrayIcon(QObject):
         Args:
             interval_ms: Polling interval in milliseconds
         """
+        self._poll_interval_ms = interval_ms
+        self._idle_polls = 0
         self._status_timer.start(interval_ms)
 
     def stop_status_polling(self) -> None:
         """Stop status polling."""
         self._status_timer.stop()
+        self._unwatch_openconnect()
+
+    def _get_backend(self):
+        """Get the backend, resolving it on first use."""
+        if self._backend is None:
+            # Import here to avoid circular imports
+            from vpn_ui.backend import get_backend
+            self._backend = get_backend()
+        return self._backend
+
+    def _watch_openconnect(self, pid: Optional[int]) -> None:
+        """Get notified as soon as openconnect exits (Linux pidfd).
+
+        The pidfd becomes readable when the process terminates, so the
+        tray reacts immediately and the poll timer can slow down.
+
+        Args:
+            pid: openconnect PID found by the status probe
+        """
+        if self._pidfd is not None or pid is None or not hasattr(os, "pidfd_open"):
+            return
+        try:
+            self._pidfd = os.pidfd_open(pid)
+        except Exception:
+            return
 
+        self._pidfd_notifier = QSocketNotifier(
+            self._pidfd, QSocketNotifier.Type.Read, self
+        )
+        self._pidfd_notifier.activated.connect(self._on_openconnect_exited)
+        if self._status_timer.isActive():
+            self._status_timer.setInterval(WATCHED_POLL_INTERVAL_MS)
+
+    def _unwatch_openconnect(self) -> None:
+        """Stop watching openconnect and restore the normal poll interval."""
+        if self._pidfd is None:
+            return
+        self._pidfd_notifier.setEnabled(False)
+        self._pidfd_notifier.deleteLater()
+        self._pidfd_notifier = None
+        os.close(self._pidfd)
+        self._pidfd = None
+        if self._status_timer.isActive():
+            self._status_timer.setInterval(self._poll_interval_ms)
+
+    def _on_openconnect_exited(self) -> None:
+        """Handle the watched openconnect process exiting."""
+        self._unwatch_openconnect()
+        # Confirm via a normal poll (a new instance may already be running)
+        try:
+            self._get_backend().invalidate_process_cache()
+        except Exception:
+            pass
+        self._poll_status()
+
+    def _reset_poll_backoff(self) -> None:
+        """Return to the normal polling interval after a status change."""
+        if self._idle_polls >= IDLE_POLLS_BEFORE_BACKOFF and self._status_timer.isActive():
+            self._status_timer.setInterval(self._poll_interval_ms)
+        self._idle_polls = 0
+
+    @pyqtSlot()
     def _poll_status(self) -> None:
         """Poll VPN connection status.
 
         This is called by the timer to check if openconnect is running.
+        The probe runs on the thread pool so a slow backend never blocks
+        the event loop; _apply_poll_result handles the outcome.
         """
-        # Import here to avoid circular imports
-        from vpn_ui.backend import get_backend
+        if self._poll_in_flight:
+            return
+        self._poll_in_flight = True
+        self._poll_dispatched = (self._current_status, self._current_connection)
+        # While a connect flow is in progress, trust the user-selected target
+        # and avoid stale state/inference from a previous tunnel.
+        want_name = not (
+            self._current_status == STATUS_CONNECTED
+            or (self._current_status == STATUS_CONNECTING and self._current_connection)
+        )
+        run_in_background(
+            self._probe_status,
+            want_name,
+            self._pidfd is None,
+            on_result=self._apply_poll_result,
+            on_error=self._on_poll_error,
+        )
+
+    def _probe_status(self, want_name: bool, want_pid: bool) -> tuple:
+        """Check for openconnect and resolve the connection name (worker thread).
+
+        Args:
+            want_name: Whether to look up the connection name when connected
+            want_pid: Whether to look up the PID (no process is watched yet)
 
+        Returns:
+            (is_connected, connection name or None, openconnect PID or None)
+        """
+        backend = self._get_backend()
+        if not backend.is_connected():
+            return False, None, None
+        pid = backend.get_openconnect_pid() if want_pid else None
+        if not want_name:
+            return True, None, pid
+
+        conn_name = None
         try:
-            backend = get_backend()
-            is_connected = backend.is_connected()
+            # First try the state file
+            conn_name = backend.get_active_connection()
+            if not conn_name:
+                # Try to infer from openconnect process arguments
+                conn_name = backend.infer_connection_name()
+                if conn_name:
+                    # Save it to state so we don't have to infer again
+                    backend.save_active_connection(conn_name)
         except Exception:
-            is_connected = False
+            pass
+        return True, conn_name, pid
+
+    @pyqtSlot(str)
+    def _on_poll_error(self, message: str) -> None:
+        """Treat a failed probe as 'not connected', like a missing process."""
+        self._apply_poll_result((False, None, None))
+
+    @pyqtSlot(object)
+    def _apply_poll_result(self, result: tuple) -> None:
+        """Update the tray from a finished status probe."""
+        self._poll_in_flight = False
+        if (self._current_status, self._current_connection) != self._poll_dispatched:
+            # Status changed while probing; the next poll sees the new state
+            return
+        is_connected, conn_name, pid = result
+
+        if not is_connected and self._current_status == STATUS_DISCONNECTED:
+            # Nothing changed; slow down after a few idle polls
+            self._idle_polls += 1
+            if self._idle_polls == IDLE_POLLS_BEFORE_BACKOFF:
+                self._status_timer.setInterval(IDLE_POLL_INTERVAL_MS)
+            return
+
+        backend = self._get_backend()
 
         # Update status based on poll result
         if is_connected:
-            # While a connect flow is in progress, trust the user-selected target
-            # and avoid stale state/inference from a previous tunnel.
             if self._current_status == STATUS_CONNECTING and self._current_connection:
                 self.set_status(STATUS_CONNECTED, self._current_connection)
                 try:
                     backend.save_active_connection(self._current_connection)
                 except Exception:
                     pass
-                return
-
-            if self._current_status != STATUS_CONNECTED:
-                # VPN connected - try to get connection name from state
-                conn_name = "Unknown"
-                try:
-                    # First try the state file
-                    active_conn = backend.get_active_connection()
-                    if active_conn:
-                        conn_name = active_conn
-                    else:
-                        # Try to infer from openconnect process arguments
-                        inferred = backend.infer_connection_name()
-                        if inferred:
-                            conn_name = inferred
-                            # Save it to state so we don't have to infer again
-                            backend.save_active_connection(inferred)
-                except Exception:
-                    pass
-                self.set_status(STATUS_CONNECTED, conn_name)
+            elif self._current_status != STATUS_CONNECTED:
+                # VPN connected - name comes from state file or inference
+                self.set_status(STATUS_CONNECTED, conn_name or "Unknown")
+            # Watch the PID the probe found; this also picks up a new
+            # instance after the watched one exited (e.g. a reconnect)
+            self._watch_openconnect(pid)
         else:
             if self._current_status != STATUS_DISCONNECTED:
                 # VPN disconnected externally - clear state
@@ -285,9 +483,12 @@ class VPNTrayIcon(QObject):
         return self.tray.isVisible()
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_system_tray_available() -> bool:
         """Check if system tray is available.
 
+        The platform probe runs once; later calls reuse the answer.
+
         Returns:
             True if system tray is available
         """
@@ -1,24 +1,66 @@
 """QThread workers for async VPN operations."""
 
 import os
-import time
-from typing import Optional, TYPE_CHECKING
+import threading
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 
 if TYPE_CHECKING:
     from vpn_ui.backend.base import VPNBackendProtocol
 
 
-class VPNConnectWorker(QObject):
-    """Worker for VPN connection operations."""
+class VPNWorkerThread(QThread):
+    """Base thread for VPN operations.
+
+    Connect and disconnect deliberately get their own QThread rather than
+    a QThreadPool slot (see run_in_background for short tasks): a connect
+    worker can block for the whole VPN session, which would pin a pool
+    thread, and these operations are far too rare for thread start-up to
+    matter.
+
+    Subclasses implement run() and emit the signals below directly from
+    the thread; QThread's own started signal marks the beginning.
+    """
 
     # Signals
-    started = pyqtSignal()
     progress = pyqtSignal(str)  # Status message
     finished = pyqtSignal(bool, str)  # success, message
     error = pyqtSignal(str)  # error message
 
+    def __init__(self):
+        """Initialize the worker thread."""
+        super().__init__()
+        self._cancel_event = threading.Event()
+        self._last_progress: Optional[str] = None
+        self._last_error: Optional[str] = None
+
+    def _emit_progress(self, message: str) -> None:
+        """Emit progress unless it repeats the previous message."""
+        if message == self._last_progress:
+            return
+        self._last_progress = message
+        self.progress.emit(message)
+
+    def _emit_error(self, message: str) -> None:
+        """Emit an error unless it repeats the previous one."""
+        if message == self._last_error:
+            return
+        self._last_error = message
+        self.error.emit(message)
+
+    def cancel(self) -> None:
+        """Cancel the operation.
+
+        Wakes any retry delay immediately; a backend call already in
+        progress still runs to completion.
+        """
+        self._cancel_event.set()
+
+
+class VPNConnectWorker(VPNWorkerThread):
+    """Thread for VPN connection operations."""
+
     def __init__(
         self,
         backend: "VPNBackendProtocol",
@@ -45,17 +87,14 @@ class VPNConnectWorker(QObject):
         self.debug = debug
         self.no_cache = no_cache
         self.no_dtls = no_dtls
-        self._is_cancelled = False
 
     def run(self) -> None:
         """Execute the connection operation."""
-        self.started.emit()
-
         try:
             # Get connection configuration
             config = self.backend.get_config(self.connection_name)
             if not config:
-                self.error.emit(f"Connection '{self.connection_name}' not found")
+                self._emit_error(f"Connection '{self.connection_name}' not found")
                 self.finished.emit(False, f"Connection '{self.connection_name}' not found")
                 return
 
@@ -100,20 +139,17 @@ class VPNConnectWorker(QObject):
             auth_ok = False
 
             for connect_attempt in range(max_connect_attempts):
-                if self._is_cancelled:
+                if self._cancel_event.is_set():
                     self.finished.emit(False, "Cancelled")
                     return
 
                 if connect_attempt > 0:
-                    self.progress.emit(
+                    self._emit_progress(
                         f"Connection lost/failed. Watchdog retry {connect_attempt + 1}/{max_connect_attempts}..."
                     )
-                    if reconnect_delay_seconds > 0:
-                        for _ in range(reconnect_delay_seconds * 2):
-                            if self._is_cancelled:
-                                self.finished.emit(False, "Cancelled")
-                                return
-                            time.sleep(0.5)
+                    if self._cancel_event.wait(reconnect_delay_seconds):
+                        self.finished.emit(False, "Cancelled")
+                        return
 
                 # Try cached cookies once on first attempt.
                 if not cached_checked:
@@ -121,8 +157,7 @@ class VPNConnectWorker(QObject):
                     cached = self.backend.get_stored_cookies(name)
                     if cached:
                         cached_cookies, cached_usergroup = cached
-                        self.progress.emit("Using cached session...")
-                        self.progress.emit(f"Reconnecting to {name} with cached credentials...")
+                        self._emit_progress(f"Reconnecting to {name} with cached session...")
                         success = self._try_connect(
                             address, protocol, cached_cookies, username,
                             cached_usergroup, allow_fallback=True
@@ -134,22 +169,19 @@ class VPNConnectWorker(QObject):
 
                 # Fresh auth + connect cycle.
                 for auth_attempt in range(fresh_auth_attempts):
-                    if self._is_cancelled:
+                    if self._cancel_event.is_set():
                         self.finished.emit(False, "Cancelled")
                         return
 
                     if auth_attempt == 0:
-                        self.progress.emit(f"Authenticating to {name}...")
+                        self._emit_progress(f"Authenticating to {name}...")
                     else:
-                        self.progress.emit(
+                        self._emit_progress(
                             f"Retrying authentication ({auth_attempt + 1}/{fresh_auth_attempts})..."
                         )
-                        if anyconnect_retry_delay_seconds > 0:
-                            for _ in range(anyconnect_retry_delay_seconds * 2):
-                                if self._is_cancelled:
-                                    self.finished.emit(False, "Cancelled")
-                                    return
-                                time.sleep(0.5)
+                        if self._cancel_event.wait(anyconnect_retry_delay_seconds):
+                            self.finished.emit(False, "Cancelled")
+                            return
 
                     cookies = self.backend.do_saml_auth(
                         vpn_server=address,
@@ -165,7 +197,7 @@ class VPNConnectWorker(QObject):
                         continue
                     auth_ok = True
 
-                    if self._is_cancelled:
+                    if self._cancel_event.is_set():
                         self.finished.emit(False, "Cancelled")
                         return
 
@@ -173,7 +205,7 @@ class VPNConnectWorker(QObject):
                     self.backend.store_cookies(name, cookies, usergroup='portal:prelogin-cookie')
 
                     # Connect
-                    self.progress.emit(f"Connecting to {address}...")
+                    self._emit_progress(f"Connecting to {address}...")
                     success = self._try_connect(
                         address, protocol, cookies, username,
                         connection_name=name, allow_fallback=False
@@ -188,11 +220,11 @@ class VPNConnectWorker(QObject):
             if auth_ok:
                 self.finished.emit(False, f"Failed to connect to {name} after {max_connect_attempts} attempts")
             else:
-                self.error.emit("Authentication failed")
+                self._emit_error("Authentication failed")
                 self.finished.emit(False, "Authentication failed after retries")
 
         except Exception as e:
-            self.error.emit(str(e))
+            self._emit_error(str(e))
             self.finished.emit(False, str(e))
 
     def _try_connect(
@@ -234,19 +266,9 @@ class VPNConnectWorker(QObject):
             cached_usergroup=cached_usergroup,
         )
 
-    def cancel(self) -> None:
-        """Cancel the operation."""
-        self._is_cancelled = True
-
 
-class VPNDisconnectWorker(QObject):
-    """Worker for VPN disconnection."""
-
-    # Signals
-    started = pyqtSignal()
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(bool, str)
-    error = pyqtSignal(str)
+class VPNDisconnectWorker(VPNWorkerThread):
+    """Thread for VPN disconnection."""
 
     def __init__(self, backend: "VPNBackendProtocol", force: bool = False):
         """Initialize disconnect worker.
@@ -262,7 +284,6 @@ class VPNDisconnectWorker(QObject):
 
     def run(self) -> None:
         """Execute the disconnect operation."""
-        self.started.emit()
         self.progress.emit("Disconnecting...")
 
         try:
@@ -277,45 +298,80 @@ class VPNDisconnectWorker(QObject):
             self.finished.emit(False, str(e))
 
 
-class VPNWorkerThread(QThread):
-    """Thread wrapper for VPN workers."""
+class _TaskSignals(QObject):
+    """Signals for a BackgroundTask (QRunnable is not a QObject)."""
 
-    # Forward signals from worker
-    started = pyqtSignal()
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(bool, str)
+    result = pyqtSignal(object)
     error = pyqtSignal(str)
+    done = pyqtSignal()
+
 
-    def __init__(self, worker: QObject):
-        """Initialize the worker thread.
+class BackgroundTask(QRunnable):
+    """Run a short function on the global thread pool."""
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        """Initialize the task.
 
         Args:
-            worker: Worker object (VPNConnectWorker or VPNDisconnectWorker)
+            fn: Function to call in the pool thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
         """
         super().__init__()
-        self.worker = worker
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        """Call the function and emit its result or error."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.done.emit()
 
-        # Connect worker signals to thread signals
-        self.worker.started.connect(self.started.emit)
-        self.worker.progress.connect(self.progress.emit)
-        self.worker.finished.connect(self._on_finished)
-        self.worker.error.connect(self.error.emit)
 
-        # Move worker to this thread
-        self.worker.moveToThread(self)
+# Tasks in flight; keeps their signal objects alive until delivery
+_active_tasks: set = set()
 
-    def _on_finished(self, success: bool, message: str) -> None:
-        """Handle worker finished signal."""
-        self.finished.emit(success, message)
 
-    def run(self) -> None:
-        """Run the worker."""
-        self.worker.run()
+def run_in_background(
+    fn: Callable[..., Any],
+    *args,
+    on_result: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[str], None]] = None,
+    **kwargs
+) -> BackgroundTask:
+    """Run fn(*args, **kwargs) on QThreadPool.globalInstance().
 
-    def cancel(self) -> None:
-        """Cancel the worker if possible."""
-        if hasattr(self.worker, 'cancel'):
-            self.worker.cancel()
+    Callbacks are delivered on the calling (GUI) thread. Use this for
+    short blocking calls only; long-running VPN operations keep their
+    own VPNWorkerThread.
+
+    Args:
+        fn: Function to call
+        *args: Positional arguments for fn
+        on_result: Called with the return value on success
+        on_error: Called with the error message on failure
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        The submitted BackgroundTask
+    """
+    task = BackgroundTask(fn, *args, **kwargs)
+    if on_result is not None:
+        task.signals.result.connect(on_result)
+    if on_error is not None:
+        task.signals.error.connect(on_error)
+    task.signals.done.connect(lambda: _active_tasks.discard(task))
+    _active_tasks.add(task)
+    QThreadPool.globalInstance().start(task)
+    return task
 
 
 def create_connect_thread(
@@ -331,10 +387,9 @@ def create_connect_thread(
         **kwargs: Additional arguments for VPNConnectWorker
 
     Returns:
-        Configured VPNWorkerThread
+        Configured VPNConnectWorker thread
     """
-    worker = VPNConnectWorker(backend, connection_name, **kwargs)
-    return VPNWorkerThread(worker)
+    return VPNConnectWorker(backend, connection_name, **kwargs)
 
 
 def create_disconnect_thread(
@@ -348,7 +403,6 @@ def create_disconnect_thread(
         force: If True, terminate the session
 
     Returns:
-        Configured VPNWorkerThread
+        Configured VPNDisconnectWorker thread
     """
-    worker = VPNDisconnectWorker(backend, force)
-    return VPNWorkerThread(worker)
+    return VPNDisconnectWorker(backend, force)
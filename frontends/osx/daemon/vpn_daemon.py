@@ -28,6 +28,9 @@ DAEMON_VERSION = "1.0.0"
 SOCKET_PATH = "/var/run/ms-sso-openconnect/daemon.sock"
 PID_FILE = "/var/run/ms-sso-openconnect/daemon.pid"
 
+# Close client connections that stay idle this long (seconds)
+CLIENT_IDLE_TIMEOUT = 30
+
 # Search paths for openconnect binary
 OPENCONNECT_PATHS = [
     "/opt/homebrew/bin/openconnect",
@@ -62,30 +65,35 @@ class VPNDaemon:
         self._running = True
 
     async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle a client connection."""
-        try:
-            data = await asyncio.wait_for(reader.readline(), timeout=30)
-            if not data:
-                return
+        """Handle a client connection.
 
-            request_str = data.decode().strip()
-            try:
-                request = json.loads(request_str)
-            except json.JSONDecodeError:
-                response = {"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}, "id": 0}
+        Clients may keep the connection open and send one request per line;
+        it is closed on EOF or after CLIENT_IDLE_TIMEOUT without a request.
+        """
+        try:
+            while self._running:
+                data = await asyncio.wait_for(reader.readline(), timeout=CLIENT_IDLE_TIMEOUT)
+                if not data:
+                    return
+
+                request_str = data.decode().strip()
+                try:
+                    request = json.loads(request_str)
+                except json.JSONDecodeError:
+                    response = {"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}, "id": 0}
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    await writer.drain()
+                    continue
+
+                method = request.get("method", "")
+                params = request.get("params", {})
+                req_id = request.get("id", 0)
+
+                # Dispatch to handler
+                result = await self._dispatch(method, params)
+                response = {"jsonrpc": "2.0", "result": result, "id": req_id}
                 writer.write(json.dumps(response).encode() + b"\n")
                 await writer.drain()
-                return
-
-            method = request.get("method", "")
-            params = request.get("params", {})
-            req_id = request.get("id", 0)
-
-            # Dispatch to handler
-            result = await self._dispatch(method, params)
-            response = {"jsonrpc": "2.0", "result": result, "id": req_id}
-            writer.write(json.dumps(response).encode() + b"\n")
-            await writer.drain()
 
         except asyncio.TimeoutError:
             pass
@@ -16,9 +16,11 @@ Usage:
     ./ms-sso-openconnect --visible          (show browser for debugging)
     ./ms-sso-openconnect -d                 (disconnect, keep session alive)
     ./ms-sso-openconnect --force-disconnect (disconnect and terminate session)
+    ./ms-sso-openconnect --quiet            (no colors or header, for scripts)
 """
 
 import argparse
+import functools
 import getpass
 import os
 import sys
@@ -31,64 +33,87 @@ codebase_root = project_root / "codebase"
 if (codebase_root / "core").exists():
     sys.path.insert(0, str(codebase_root))
 
-# Import from core module
-from core import (
-    # Config
-    get_connections,
-    get_connection,
-    save_connection,
-    delete_connection,
-    get_config,
-    PROTOCOLS,
-    # Cookies
-    store_cookies,
-    get_stored_cookies,
-    clear_stored_cookies,
-    # Auth
-    do_saml_auth,
-    # Connect
-    connect_vpn,
-    disconnect,
+# core is imported inside each command so that --help and argument errors
+# don't load keyring and the VPN stack.
+
+# Terminal colors and header, only when writing to a terminal
+INTERACTIVE = sys.stdout.isatty()
+if INTERACTIVE:
+    GREEN = "\033[32m"
+    RED = "\033[31m"
+    YELLOW = "\033[33m"
+    CYAN = "\033[36m"
+    BOLD = "\033[1m"
+    NC = "\033[0m"
+else:
+    GREEN = RED = YELLOW = CYAN = BOLD = NC = ""
+
+HEADER = (
+    f"{GREEN}{'=' * 40}{NC}\n"
+    f"{GREEN}    MS SSO OpenConnect - VPN Client{NC}\n"
+    f"{GREEN}{'=' * 40}{NC}\n"
+    "\n"
 )
 
-# Terminal colors
-GREEN = "\033[32m"
-RED = "\033[31m"
-YELLOW = "\033[33m"
-CYAN = "\033[36m"
-BOLD = "\033[1m"
-NC = "\033[0m"
+
+def set_quiet():
+    """Disable colors and the header regardless of the terminal (--quiet)."""
+    global INTERACTIVE, GREEN, RED, YELLOW, CYAN, BOLD, NC
+    INTERACTIVE = False
+    GREEN = RED = YELLOW = CYAN = BOLD = NC = ""
+    # core prints its own status lines. --help and argument errors exit
+    # before this, so core is only loaded here when a command runs anyway.
+    from core import disable_colors
+    disable_colors()
 
 
 def print_header():
     """Print application header."""
-    print(f"{GREEN}========================================{NC}")
-    print(f"{GREEN}    MS SSO OpenConnect - VPN Client{NC}")
-    print(f"{GREEN}========================================{NC}")
-    print()
+    if INTERACTIVE:
+        sys.stdout.write(HEADER)
+
+
+@functools.lru_cache(maxsize=1)
+def load_connections():
+    """Read saved connections from the keyring once per invocation."""
+    from core import get_connections
+
+    return get_connections()
+
+
+@functools.lru_cache(maxsize=1)
+def protocol_names():
+    """Map protocol keys to their display names."""
+    from core import PROTOCOLS
 
+    return {key: val["name"] for key, val in PROTOCOLS.items()}
 
-def list_connections_cmd():
+
+def list_connections_cmd(connections):
     """List all saved VPN connections."""
-    connections = get_connections()
     if not connections:
         print(f"{YELLOW}No saved connections.{NC}")
         print(f"Use --setup to add a connection.")
         return
 
-    print(f"{GREEN}Saved VPN connections:{NC}\n")
+    # Build the whole listing and write it once
+    proto_names = protocol_names()
+    parts = [f"{GREEN}Saved VPN connections:{NC}\n\n"]
     for name, details in connections.items():
-        protocol_name = PROTOCOLS.get(details.get("protocol", ""), {}).get("name", "Unknown")
-        print(f"  {BOLD}{name}{NC}")
-        print(f"    Server: {details.get('address', 'N/A')}")
-        print(f"    Protocol: {protocol_name}")
-        print(f"    Username: {details.get('username', 'N/A')}")
-        print()
+        protocol_name = proto_names.get(details.get("protocol", ""), "Unknown")
+        parts.append(
+            f"  {BOLD}{name}{NC}\n"
+            f"    Server: {details.get('address', 'N/A')}\n"
+            f"    Protocol: {protocol_name}\n"
+            f"    Username: {details.get('username', 'N/A')}\n"
+            "\n"
+        )
+    sys.stdout.write("".join(parts))
 
 
-def setup_config_cmd(edit_name=None):
+def setup_config_cmd(connections, edit_name=None):
     """Interactive setup for VPN connection."""
-    connections = get_connections()
+    from core import normalize_secret, save_connection, secret_error
 
     # Determine if editing existing or creating new
     if edit_name and edit_name in connections:
@@ -115,16 +140,17 @@ def setup_config_cmd(edit_name=None):
         return
 
     # Protocol selection
+    proto_names = protocol_names()
+    default_proto = existing.get('protocol', 'anyconnect')
     print(f"\nAvailable protocols:")
-    for key, val in PROTOCOLS.items():
-        marker = "*" if key == existing.get('protocol', 'anyconnect') else " "
-        print(f"  {marker} {key}: {val['name']}")
+    for key, label in proto_names.items():
+        marker = "*" if key == default_proto else " "
+        print(f"  {marker} {key}: {label}")
 
-    default_proto = existing.get('protocol', 'anyconnect')
     protocol = input(f"Protocol [{default_proto}]: ").strip().lower()
     if not protocol:
         protocol = default_proto
-    if protocol not in PROTOCOLS:
+    if protocol not in proto_names:
         print(f"{RED}Invalid protocol. Using 'anyconnect'.{NC}")
         protocol = 'anyconnect'
 
@@ -156,17 +182,24 @@ def setup_config_cmd(edit_name=None):
             totp_secret = default_totp
     else:
         totp_secret = input("TOTP secret (base32): ").strip()
+    totp_secret = normalize_secret(totp_secret)
+    error = secret_error(totp_secret)
+    if error:
+        print(f"{RED}Invalid TOTP secret: {error}{NC}")
+        return
 
     # Save
-    if save_connection(name, address, protocol, username, password, totp_secret):
+    saved = save_connection(name, address, protocol, username, password, totp_secret)
+    load_connections.cache_clear()
+    if saved:
         print(f"\n{GREEN}Connection '{name}' saved successfully.{NC}")
     else:
         print(f"\n{RED}Failed to save connection.{NC}")
 
 
-def delete_config_cmd(name=None):
+def delete_config_cmd(connections, name=None):
     """Delete a VPN connection."""
-    connections = get_connections()
+    from core import delete_connection
 
     if not connections:
         print(f"{YELLOW}No connections to delete.{NC}")
@@ -183,24 +216,23 @@ def delete_config_cmd(name=None):
     confirm = input(f"Delete '{name}'? [y/N]: ").strip().lower()
     if confirm == 'y':
         delete_connection(name)
+        load_connections.cache_clear()
         print(f"{GREEN}Connection '{name}' deleted.{NC}")
     else:
         print("Cancelled.")
 
 
-def select_connection_cmd():
+def select_connection_cmd(connections):
     """Interactive connection selection."""
-    connections = get_connections()
-
     if not connections:
         print(f"{RED}No saved connections. Use --setup to add one.{NC}")
         sys.exit(1)
 
     if len(connections) == 1:
-        return list(connections.keys())[0]
+        return next(iter(connections))
 
     print(f"Available connections:")
-    names = list(connections.keys())
+    names = tuple(connections)
     for i, name in enumerate(names, 1):
         print(f"  {i}. {name}")
 
@@ -211,74 +243,42 @@ def select_connection_cmd():
             if 0 <= idx < len(names):
                 return names[idx]
         except ValueError:
-            if choice in names:
+            if choice in connections:
                 return choice
         print(f"{RED}Invalid selection.{NC}")
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="OpenConnect VPN with Microsoft SSO authentication (AnyConnect & GlobalProtect)"
+def connect_cmd(args):
+    """Connect to the selected VPN connection, with auto-reconnect."""
+    from core import (
+        get_config,
+        store_cookies,
+        get_stored_cookies,
+        clear_stored_cookies,
+        do_saml_auth,
+        connect_vpn,
     )
-    parser.add_argument("name", nargs="?", help="Connection name to connect to")
-    parser.add_argument("--visible", action="store_true", help="Show browser window for debugging")
-    parser.add_argument("--debug", action="store_true", help="Enable debug output and screenshots")
-    parser.add_argument("--disconnect", "-d", action="store_true", help="Disconnect (keep session alive)")
-    parser.add_argument("--force-disconnect", action="store_true", help="Disconnect and terminate session")
-    parser.add_argument("--setup", "-s", action="store_true", help="Add/edit VPN connection")
-    parser.add_argument("--list", "-l", action="store_true", help="List saved connections")
-    parser.add_argument("--delete", action="store_true", help="Delete connection from keyring")
-    parser.add_argument("--no-cache", action="store_true", help="Force re-authentication")
-    parser.add_argument("--no-dtls", action="store_true", help="Disable DTLS (use TCP only)")
-
-    args = parser.parse_args()
-
-    print_header()
-
-    # Handle disconnect commands
-    if args.disconnect:
-        disconnect(force=False)
-        return
-
-    if args.force_disconnect:
-        disconnect(force=True)
-        return
-
-    # Handle management commands
-    if args.list:
-        list_connections_cmd()
-        return
-
-    if args.setup:
-        setup_config_cmd(edit_name=args.name)
-        return
-
-    if args.delete:
-        delete_config_cmd(name=args.name)
-        return
 
-    # Connect flow
     # Determine which connection to use
     if args.name:
         conn_name = args.name
     else:
-        conn_name = select_connection_cmd()
+        conn_name = select_connection_cmd(load_connections())
 
-    config = get_config(conn_name)
+    config = get_config(conn_name, load_connections())
     if not config:
         print(f"{RED}Connection '{conn_name}' not found. Use --setup to configure.{NC}")
         sys.exit(1)
 
     conn_name, address, protocol, username, password, totp_secret = config
 
-    if not all([conn_name, address, protocol, username, password, totp_secret]):
+    if not (conn_name and address and protocol and username and password and totp_secret):
         print(f"{RED}Connection incomplete. Use --setup to configure.{NC}")
         sys.exit(1)
 
     print(f"{GREEN}Connection: {conn_name}{NC}")
     print(f"{GREEN}VPN Server: {address}{NC}")
-    print(f"{GREEN}Protocol: {PROTOCOLS.get(protocol, {}).get('name', protocol)}{NC}")
+    print(f"{GREEN}Protocol: {protocol_names().get(protocol, protocol)}{NC}")
     print(f"{GREEN}Username: {username}{NC}")
     print(f"{GREEN}TOTP code will be generated automatically.{NC}\n")
 
@@ -399,5 +399,66 @@ def main():
     sys.exit(1)
 
 
+def main():
+    """Main entry point."""
+    argv = sys.argv[1:]
+    if not argv:
+        # Bare invocation: connect to the default connection, no parser needed
+        print_header()
+        connect_cmd(argparse.Namespace(
+            name=None, visible=False, debug=False, no_cache=False, no_dtls=False
+        ))
+        return
+
+    parser = argparse.ArgumentParser(
+        description="OpenConnect VPN with Microsoft SSO authentication (AnyConnect & GlobalProtect)"
+    )
+    parser.add_argument("name", nargs="?", help="Connection name to connect to")
+    parser.add_argument("--visible", action="store_true", help="Show browser window for debugging")
+    parser.add_argument("--debug", action="store_true", help="Enable debug output and screenshots")
+    parser.add_argument("--disconnect", "-d", action="store_true", help="Disconnect (keep session alive)")
+    parser.add_argument("--force-disconnect", action="store_true", help="Disconnect and terminate session")
+    parser.add_argument("--setup", "-s", action="store_true", help="Add/edit VPN connection")
+    parser.add_argument("--list", "-l", action="store_true", help="List saved connections")
+    parser.add_argument("--delete", action="store_true", help="Delete connection from keyring")
+    parser.add_argument("--no-cache", action="store_true", help="Force re-authentication")
+    parser.add_argument("--no-dtls", action="store_true", help="Disable DTLS (use TCP only)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="No colors or header (for scripts)")
+
+    args = parser.parse_args(argv)
+    if args.quiet:
+        set_quiet()
+
+    print_header()
+
+    # Handle disconnect commands
+    if args.disconnect:
+        from core import disconnect
+
+        disconnect(force=False)
+        return
+
+    if args.force_disconnect:
+        from core import disconnect
+
+        disconnect(force=True)
+        return
+
+    # Handle management commands
+    if args.list:
+        list_connections_cmd(load_connections())
+        return
+
+    if args.setup:
+        setup_config_cmd(load_connections(), edit_name=args.name)
+        return
+
+    if args.delete:
+        delete_config_cmd(load_connections(), name=args.name)
+        return
+
+    connect_cmd(args)
+
+
 if __name__ == "__main__":
     main()